@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Shared path setup for the demo scripts - makes the in-tree src/ package importable.
+"""
+
+import sys
+from pathlib import Path
+
+_SRC_DIR = str( Path( __file__ ).parent / "src" );
+
+# Module import is cached, so this runs once however many demos import it
+if _SRC_DIR not in sys.path:
+    sys.path.insert( 0, _SRC_DIR );
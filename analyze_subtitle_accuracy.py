@@ -6,10 +6,60 @@ This script provides detailed analysis of timing differences and accuracy metric
 """
 import sys
 import re
+import bisect
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Tuple
-import statistics
 
+import numpy as np
+
+
+# Precompiled once; parse_srt_file runs this for every file
+_BLOCK_SPLIT_RE = re.compile( r'\n\s*\n' );
+
+# Correction grades: both accuracy and precision must fall below a cut to earn its grade
+_GRADE_CUTS = ( 0.1, 0.5, 1.0 );
+_GRADES = ( "Excellent", "Good", "Fair", "Poor" );
+
+
+def is_srt_time( t: str ) -> bool:
+    """Check the fixed HH:MM:SS,mmm layout: separators in place and ASCII digits only."""
+    if t[2:3] != ':' or t[5:6] != ':' or t[8:9] != ',':
+        return False;
+    digits = t[0:2] + t[3:5] + t[6:8] + t[9:12];
+    # str.isdigit() alone also accepts digits like '²' that int() rejects
+    return len( digits ) == 9 and digits.isascii() and digits.isdigit();
+
+
+def srt_times_to_seconds( times: List[str] ) -> np.ndarray:
+    """Convert a batch of SRT time strings (HH:MM:SS,mmm) to seconds in one vectorized pass."""
+    count = len( times );
+    hours = np.fromiter( ( int( t[0:2] ) for t in times ), dtype=np.int64, count=count );
+    minutes = np.fromiter( ( int( t[3:5] ) for t in times ), dtype=np.int64, count=count );
+    seconds = np.fromiter( ( int( t[6:8] ) for t in times ), dtype=np.int64, count=count );
+    millis = np.fromiter( ( int( t[9:12] ) for t in times ), dtype=np.int64, count=count );
+    return ( hours * 3_600_000 + minutes * 60_000 + seconds * 1000 + millis ) / 1000.0;
+
+
+def summarize_differences( diffs: np.ndarray ) -> Dict:
+    """Summarize (N, 2) start/end differences; each reduction covers both columns in one pass."""
+    mean = diffs.mean( axis=0 );
+    std = diffs.std( axis=0, ddof=1 ) if len( diffs ) > 1 else np.zeros( 2 );
+    median = np.median( diffs, axis=0 );
+    low = diffs.min( axis=0 );
+    high = diffs.max( axis=0 );
+    
+    return {
+        'count': len( diffs ),
+        'start_mean': float( mean[0] ),
+        'start_std': float( std[0] ),
+        'start_median': float( median[0] ),
+        'end_mean': float( mean[1] ),
+        'end_std': float( std[1] ),
+        'end_median': float( median[1] ),
+        'start_range': ( float( low[0] ), float( high[0] ) ),
+        'end_range': ( float( low[1] ), float( high[1] ) )
+    };
 
 class SubtitleEntry:
     """Represents a single subtitle entry with timing and text."""
@@ -18,26 +68,8 @@ class SubtitleEntry:
         self.index = index;
         self.start_time = start_time;
         self.end_time = end_time;
-        self.text = text.strip();
-        
-        # Convert times to seconds for calculations
-        self.start_seconds = self.time_to_seconds( start_time );
-        self.end_seconds = self.time_to_seconds( end_time );
-    
-    def time_to_seconds( self, time_str: str ) -> float:
-        """Convert SRT time format to seconds."""
-        parts = time_str.replace( ',', '.' ).split( ':' );
-        hours = int( parts[0] );
-        minutes = int( parts[1] );
-        seconds = float( parts[2] );
-        return hours * 3600 + minutes * 60 + seconds;
-    
-    def seconds_to_time( self, seconds: float ) -> str:
-        """Convert seconds back to SRT time format."""
-        hours = int( seconds // 3600 );
-        minutes = int( (seconds % 3600) // 60 );
-        secs = seconds % 60;
-        return f"{hours:02d}:{minutes:02d}:{secs:06.3f}".replace( '.', ',' );
+        self.text = text;  # Already stripped by the parser
+        self.text_key = hash( self.text );  # Content-match key, avoids re-stripping and string compares
     
     def __repr__( self ):
         return f"SubtitleEntry({self.index}, {self.start_time}->{self.end_time}, '{self.text[:30]}...')";
@@ -50,34 +82,62 @@ class SubtitleAnalyzer:
         self.original_entries = [];
         self.modified_entries = [];
         self.corrected_entries = [];
+        
+        # Timings kept as parallel arrays (SoA) for vectorized comparisons
+        self.original_start = self.original_end = np.empty( 0 );
+        self.modified_start = self.modified_end = np.empty( 0 );
+        self.corrected_start = self.corrected_end = np.empty( 0 );
+        self.original_text_h = self.modified_text_h = self.corrected_text_h = np.empty( 0, dtype=np.int64 );
+    
+    def timing_arrays( self, entries: List[SubtitleEntry] ) -> Tuple[np.ndarray, np.ndarray]:
+        """Build start/end second arrays for a list of entries."""
+        start = srt_times_to_seconds( [ e.start_time for e in entries ] );
+        end = srt_times_to_seconds( [ e.end_time for e in entries ] );
+        return start, end;
+    
+    def text_hashes( self, entries: List[SubtitleEntry] ) -> np.ndarray:
+        """Hash entry texts once so content matching is an integer compare."""
+        return np.fromiter( ( e.text_key for e in entries ), dtype=np.int64, count=len( entries ) );
+    
+    def _matched_differences( self, base_start: np.ndarray, base_end: np.ndarray, base_h: np.ndarray,
+                              other_start: np.ndarray, other_end: np.ndarray, other_h: np.ndarray ) -> np.ndarray:
+        """Return (N, 2) start/end differences for index-aligned entries with the same content."""
+        n = min( len( base_h ), len( other_h ) );  # zip() semantics
+        mask = base_h[:n] == other_h[:n];
+        
+        # Subtract straight into one dense (N, 2) buffer - no per-column temporaries to stack
+        diffs = np.empty( ( int( np.count_nonzero( mask ) ), 2 ), dtype=np.float64 );
+        np.subtract( other_start[:n][mask], base_start[:n][mask], out=diffs[:, 0] );
+        np.subtract( other_end[:n][mask], base_end[:n][mask], out=diffs[:, 1] );
+        return diffs;
     
     def parse_srt_file( self, file_path: Path ) -> List[SubtitleEntry]:
         """Parse an SRT file into SubtitleEntry objects."""
         entries = [];
         
-        if not file_path.exists():
+        try:
+            content = file_path.read_text( encoding='utf-8' );
+        except FileNotFoundError:
             print( f"Warning: File not found: {file_path}" );
             return entries;
         
-        with open( file_path, 'r', encoding='utf-8' ) as f:
-            content = f.read().strip();
-        
-        # Split by double newline to get subtitle blocks
-        blocks = re.split( r'\n\s*\n', content );
+        # Split by double newline to get subtitle blocks; splitlines() also absorbs CRLF
+        blocks = _BLOCK_SPLIT_RE.split( content.strip() );
         
         for block in blocks:
-            lines = block.strip().split( '\n' );
+            lines = block.splitlines();
             if len( lines ) >= 3:
                 try:
                     index = int( lines[0] );
                     timing = lines[1];
-                    text = '\n'.join( lines[2:] );
+                    text = '\n'.join( lines[2:] ).strip();
                     
-                    # Parse timing
-                    time_match = re.match( r'(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})', timing );
-                    if time_match:
-                        start_time = time_match.group( 1 );
-                        end_time = time_match.group( 2 );
+                    # Parse timing - fixed layout "HH:MM:SS,mmm --> HH:MM:SS,mmm"
+                    if len( timing ) >= 29 and timing[12:17] == ' --> ':
+                        start_time = timing[0:12];
+                        end_time = timing[17:29];
+                        if not ( is_srt_time( start_time ) and is_srt_time( end_time ) ):
+                            continue;  # Malformed timestamp
                         entries.append( SubtitleEntry( index, start_time, end_time, text ) );
                 except ValueError:
                     continue;  # Skip malformed entries
@@ -88,73 +148,66 @@ class SubtitleAnalyzer:
         """Load all subtitle files for comparison."""
         print( f"Loading subtitle files for analysis..." );
         
-        self.original_entries = self.parse_srt_file( original_path );
+        paths = { 'original': original_path, 'modified': modified_path };
+        if corrected_path and corrected_path.exists():
+            paths['corrected'] = corrected_path;
+        
+        # Files are independent - parse them concurrently
+        with ThreadPoolExecutor( max_workers=len( paths ) ) as executor:
+            futures = { name: executor.submit( self.parse_srt_file, path ) for name, path in paths.items() };
+            parsed = { name: future.result() for name, future in futures.items() };
+        
+        self.original_entries = parsed['original'];
+        self.original_start, self.original_end = self.timing_arrays( self.original_entries );
+        self.original_text_h = self.text_hashes( self.original_entries );
         print( f"✓ Original: {len( self.original_entries )} entries" );
         
-        self.modified_entries = self.parse_srt_file( modified_path );
+        self.modified_entries = parsed['modified'];
+        self.modified_start, self.modified_end = self.timing_arrays( self.modified_entries );
+        self.modified_text_h = self.text_hashes( self.modified_entries );
         print( f"✓ Modified: {len( self.modified_entries )} entries" );
         
-        if corrected_path and corrected_path.exists():
-            self.corrected_entries = self.parse_srt_file( corrected_path );
+        if 'corrected' in parsed:
+            self.corrected_entries = parsed['corrected'];
+            self.corrected_start, self.corrected_end = self.timing_arrays( self.corrected_entries );
+            self.corrected_text_h = self.text_hashes( self.corrected_entries );
             print( f"✓ Corrected: {len( self.corrected_entries )} entries" );
         else:
             print( f"⚠ Corrected file not found - will simulate ideal correction" );
-            self.corrected_entries = self.simulate_ideal_correction();
-            print( f"✓ Simulated ideal correction: {len( self.corrected_entries )} entries" );
+            self.corrected_entries = [];
+            self.simulate_ideal_correction();
+            print( f"✓ Simulated ideal correction: {len( self.corrected_start )} entries" );
     
-    def simulate_ideal_correction( self ) -> List[SubtitleEntry]:
-        """Simulate ideal correction by subtracting the 5-second offset from modified entries."""
-        corrected = [];
-        
-        for entry in self.modified_entries:
-            # Subtract 5 seconds to get back to original timing
-            new_start = entry.start_seconds - 5.0;
-            new_end = entry.end_seconds - 5.0;
-            
-            # Ensure no negative times
-            new_start = max( 0.0, new_start );
-            new_end = max( new_start + 0.1, new_end );  # Minimum duration
-            
-            corrected.append( SubtitleEntry(
-                entry.index,
-                entry.seconds_to_time( new_start ),
-                entry.seconds_to_time( new_end ),
-                entry.text
-            ) );
-        
-        return corrected;
+    def simulate_ideal_correction( self ):
+        """Simulate ideal correction by subtracting the 5-second offset from modified timings.
+        
+        Only the corrected timing arrays are produced; texts are shared with the modified entries.
+        """
+        # Subtract 5 seconds to get back to original timing, ensuring no negative times;
+        # rounded to the millisecond resolution an SRT file would store
+        self.corrected_start = np.round( np.maximum( 0.0, self.modified_start - 5.0 ), 3 );
+        self.corrected_end = np.round( np.maximum( self.corrected_start + 0.1, self.modified_end - 5.0 ), 3 );  # Minimum duration
+        self.corrected_text_h = self.modified_text_h;
     
     def calculate_timing_differences( self ) -> Dict:
         """Calculate detailed timing difference statistics."""
         print( f"\\n=== TIMING DIFFERENCE ANALYSIS ===" );
         
         results = {
-            'original_vs_modified': [],
-            'original_vs_corrected': [],
-            'modified_vs_corrected': []
+            # Compare original vs modified (should be +5.0 seconds)
+            'original_vs_modified': self._matched_differences(
+                self.original_start, self.original_end, self.original_text_h,
+                self.modified_start, self.modified_end, self.modified_text_h ),
+            # Compare original vs corrected (should be ~0.0 seconds)
+            'original_vs_corrected': self._matched_differences(
+                self.original_start, self.original_end, self.original_text_h,
+                self.corrected_start, self.corrected_end, self.corrected_text_h ),
+            # Compare modified vs corrected (should be -5.0 seconds)
+            'modified_vs_corrected': self._matched_differences(
+                self.modified_start, self.modified_end, self.modified_text_h,
+                self.corrected_start, self.corrected_end, self.corrected_text_h )
         };
         
-        # Compare original vs modified (should be +5.0 seconds)
-        for orig, mod in zip( self.original_entries, self.modified_entries ):
-            if orig.text.strip() == mod.text.strip():  # Same content
-                start_diff = mod.start_seconds - orig.start_seconds;
-                end_diff = mod.end_seconds - orig.end_seconds;
-                results['original_vs_modified'].append( ( start_diff, end_diff ) );
-        
-        # Compare original vs corrected (should be ~0.0 seconds)
-        for orig, corr in zip( self.original_entries, self.corrected_entries ):
-            if orig.text.strip() == corr.text.strip():  # Same content
-                start_diff = corr.start_seconds - orig.start_seconds;
-                end_diff = corr.end_seconds - orig.end_seconds;
-                results['original_vs_corrected'].append( ( start_diff, end_diff ) );
-        
-        # Compare modified vs corrected (should be -5.0 seconds)
-        for mod, corr in zip( self.modified_entries, self.corrected_entries ):
-            if mod.text.strip() == corr.text.strip():  # Same content
-                start_diff = corr.start_seconds - mod.start_seconds;
-                end_diff = corr.end_seconds - mod.end_seconds;
-                results['modified_vs_corrected'].append( ( start_diff, end_diff ) );
-        
         return results;
     
     def analyze_accuracy( self, differences: Dict ) -> Dict:
@@ -164,24 +217,11 @@ class SubtitleAnalyzer:
         accuracy_metrics = {};
         
         for comparison, diffs in differences.items():
-            if not diffs:
+            if len( diffs ) == 0:
                 print( f"{comparison}: No matching entries found" );
                 continue;
             
-            start_diffs = [ d[0] for d in diffs ];
-            end_diffs = [ d[1] for d in diffs ];
-            
-            metrics = {
-                'count': len( diffs ),
-                'start_mean': statistics.mean( start_diffs ),
-                'start_std': statistics.stdev( start_diffs ) if len( start_diffs ) > 1 else 0,
-                'start_median': statistics.median( start_diffs ),
-                'end_mean': statistics.mean( end_diffs ),
-                'end_std': statistics.stdev( end_diffs ) if len( end_diffs ) > 1 else 0,
-                'end_median': statistics.median( end_diffs ),
-                'start_range': ( min( start_diffs ), max( start_diffs ) ),
-                'end_range': ( min( end_diffs ), max( end_diffs ) )
-            };
+            metrics = summarize_differences( diffs );
             
             accuracy_metrics[comparison] = metrics;
             
@@ -223,15 +263,8 @@ class SubtitleAnalyzer:
         print( f"  Accuracy (deviation from 0): {end_accuracy:.3f}s" );
         print( f"  Precision (consistency): {end_precision:.3f}s" );
         
-        # Grade the correction
-        if start_accuracy < 0.1 and start_precision < 0.1:
-            grade = "Excellent";
-        elif start_accuracy < 0.5 and start_precision < 0.5:
-            grade = "Good";
-        elif start_accuracy < 1.0 and start_precision < 1.0:
-            grade = "Fair";
-        else:
-            grade = "Poor";
+        # Grade the correction - bisect_right keeps the cuts strict (< 0.1 is Excellent)
+        grade = _GRADES[bisect.bisect_right( _GRADE_CUTS, max( start_accuracy, start_precision ) )];
         
         print( f"\\nOverall correction quality: {grade}" );
         
@@ -299,10 +332,9 @@ def main():
         
         print( f"\\n=== ANALYSIS COMPLETE ===" );
         
-    except Exception as e:
+    except ( OSError, ValueError ) as e:
+        # Expected failures (unreadable/undecodable files); anything else keeps its default traceback
         print( f"Error during analysis: {e}" );
-        import traceback;
-        traceback.print_exc();
         sys.exit( 1 );
 
 
@@ -1,75 +1,89 @@
 #!/usr/bin/env python3
 """
-Debug script to test ffmpeg-python functionality with the Matrix video.
+Debug script to test ffmpeg/ffprobe functionality with the Matrix video.
 """
-import ffmpeg
+import os
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+def probe_duration( video_file ) -> Optional[float]:
+    """Return container duration in seconds, or None if ffprobe reports none."""
+    # Only format=duration is needed - skip stream probing and JSON output entirely
+    result = subprocess.run(
+        [
+            'ffprobe', '-v', 'error',
+            '-show_entries', 'format=duration',
+            '-of', 'default=noprint_wrappers=1:nokey=1',
+            str( video_file )
+        ],
+        capture_output=True, text=True, check=True
+    );
+    output = result.stdout.strip();
+    return float( output ) if output and output != 'N/A' else None;
+
+def probe_many( paths: List[Path] ) -> Dict[Path, Optional[float]]:
+    """Probe durations for many files at once; each ffprobe runs in its own child process."""
+    if not paths:
+        return {};
+    
+    with ThreadPoolExecutor( max_workers=min( len( paths ), os.cpu_count() or 1 ) ) as executor:
+        return dict( zip( paths, executor.map( probe_duration, paths ) ) );
 
 def test_ffmpeg_probe( video_file ):
-    """Test ffmpeg.probe functionality."""
-    print( f"Testing ffmpeg.probe on: {video_file}" );
+    """Test ffprobe duration lookup."""
+    print( f"Testing ffprobe on: {video_file}" );
     
     try:
-        probe = ffmpeg.probe( str( video_file ) );
-        print( f"Probe type: {type( probe )}" );
-        print( f"Probe keys: {probe.keys() if hasattr( probe, 'keys' ) else 'No keys method'}" );
+        duration = probe_duration( video_file );
         
-        if 'format' in probe:
-            format_info = probe['format'];
-            print( f"Format info: {format_info}" );
-            if 'duration' in format_info:
-                duration = float( format_info['duration'] );
-                print( f"Duration: {duration} seconds ({duration/60:.1f} minutes)" );
-            else:
-                print( "No duration field in format" );
+        if duration is not None:
+            print( f"Duration: {duration} seconds ({duration/60:.1f} minutes)" );
         else:
-            print( "No format field in probe result" );
+            print( "No duration field in format" );
             
-    except Exception as e:
-        print( f"ffmpeg.probe failed: {e}" );
-        import traceback;
-        traceback.print_exc();
+    except ( subprocess.CalledProcessError, OSError, ValueError ) as e:
+        print( f"ffprobe failed: {e}" );
 
 def test_ffmpeg_extraction( video_file ):
     """Test basic ffmpeg audio extraction."""
     print( f"\nTesting ffmpeg extraction on: {video_file}" );
     
     try:
-        output_file = "test_sample.wav";
         start_time = 300;  # 5 minutes
         duration = 10;     # 10 seconds for quick test
         
-        stream = ffmpeg.input( str( video_file ), ss=start_time, t=duration );
-        print( f"Input stream type: {type( stream )}" );
-        
-        stream = ffmpeg.output(
-            stream,
-            output_file,
-            acodec='pcm_s16le',
-            ar=16000,
-            ac=1,
-            f='wav'
-        );
-        print( f"Output stream type: {type( stream )}" );
+        # Raw 16-bit PCM straight to stdout - no temp WAV to write, stat and unlink
+        cmd = [
+            'ffmpeg',
+            '-loglevel', 'error',
+            '-ss', str( start_time ),  # Before -i: fast input seek
+            '-t', str( duration ),
+            '-i', str( video_file ),
+            '-ac', '1',
+            '-ar', '16000',
+            '-f', 's16le',
+            'pipe:1'
+        ];
+        print( f"Command: {' '.join( cmd )}" );
         
         # Test run
         print( "Attempting to run ffmpeg..." );
-        ffmpeg.run( stream, overwrite_output=True, quiet=True );
+        proc = subprocess.run( cmd, capture_output=True, check=True );
         
         # Check result
-        output_path = Path( output_file );
-        if output_path.exists():
-            file_size = output_path.stat().st_size;
-            print( f"✓ Successfully extracted audio: {output_file} ({file_size} bytes)" );
-            output_path.unlink();  # Clean up
+        samples = np.frombuffer( proc.stdout, dtype=np.int16 );
+        if samples.size:
+            print( f"✓ Successfully extracted audio: {samples.size} samples ({samples.size / 16000:.1f}s, {samples.nbytes} bytes)" );
         else:
-            print( "✗ Audio extraction failed - no output file" );
+            print( "✗ Audio extraction failed - no samples returned" );
             
-    except Exception as e:
+    except ( subprocess.CalledProcessError, OSError ) as e:
         print( f"ffmpeg extraction failed: {e}" );
-        import traceback;
-        traceback.print_exc();
 
 def main():
     video_file = Path( "/media/michael/FASTESTARCHIVE/Archive/Media/The Matrix (1999)/The.Matrix.1999.720p.BrRip.264.YIFY.mp4" );
@@ -78,7 +92,7 @@ def main():
         print( f"Video file not found: {video_file}" );
         sys.exit( 1 );
     
-    print( f"Testing ffmpeg-python with video: {video_file.name}" );
+    print( f"Testing ffmpeg with video: {video_file.name}" );
     print( f"File size: {video_file.stat().st_size / (1024*1024):.1f} MB" );
     
     test_ffmpeg_probe( video_file );
@@ -3,11 +3,9 @@
 Demo script to test adaptive similarity threshold adjustment for challenging content.
 """
 
-import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert( 0, str( Path( __file__ ).parent / "src" ) );
+import _demo_bootstrap  # noqa: F401 - puts src/ on sys.path
 
 from subshift.sync import SubtitleSynchronizer;
 from subshift.logging import get_logger;
@@ -9,18 +9,53 @@ Demo script to test all completed SubShift improvements:
 6. Enhanced transcription preprocessing
 """
 
-import sys
-from pathlib import Path
+import logging
+from functools import lru_cache
 
-# Add src to path
-sys.path.insert( 0, str( Path( __file__ ).parent / "src" ) );
+import numpy as np
+
+import _demo_bootstrap  # noqa: F401 - puts src/ on sys.path
 
 from subshift.sync import SubtitleSynchronizer;
 from subshift.audio import AdaptiveSamplingCoordinator;
 from subshift.offset import OffsetCalculator;
-from subshift.align import AlignmentMatch;
+from subshift.align import AlignmentMatchArray;
 from subshift.logging import get_logger;
 
+from demo_fixtures import CHALLENGING_MATCHES;
+
+# Scenario tables shared by the demo functions: ( content type, consistency, success rate ),
+# ( scenario, initial threshold, samples ), ( success rate, expectation ), ( content, old samples, new samples )
+_CONTENT_SCENARIOS = (
+    ( "Clean dialogue", "consistent", 0.85 ),
+    ( "Standard content", "moderate", 0.65 ),
+    ( "Complex content (WALL-E)", "inconsistent", 0.35 ),
+);
+_THRESHOLD_SCENARIOS = (
+    ( "Default threshold", 0.65, 16 ),
+    ( "WALL-E complex audio", 0.65, 24 ),
+    ( "Very challenging", 0.6, 32 ),
+);
+_SUCCESS_SCENARIOS = (
+    ( 0.25, "Low success rate -> Multi-pass recommended" ),
+    ( 0.45, "Moderate success -> Multi-pass considered" ),
+    ( 0.75, "High success -> Single-pass sufficient" ),
+);
+_COST_SCENARIOS = (
+    ( "Short video", 4, 16 ),
+    ( "TV episode", 4, 20 ),
+    ( "Movie", 8, 24 ),
+    ( "Complex movie", 8, 32 ),
+);
+
+# Estimated accuracy improvements by new sample count
+_ACCURACY_GAINS = {
+    16: "~15%",  # Better coverage
+    20: "~25%",  # Enhanced sampling
+    24: "~35%",  # Multi-modal content
+    32: "~45%",  # Very challenging content
+};
+
 def test_improvement_integration():
     """Test all improvements working together."""
     
@@ -28,220 +63,123 @@ def test_improvement_integration():
     logger.info( "=== TESTING COMPLETE SUBSHIFT IMPROVEMENTS ===" );
     
     # Simulate a challenging scenario similar to WALL-E
-    logger.info( f"\\n=== SIMULATED CHALLENGING CONTENT SCENARIO ===" );
+    logger.info( "\\n=== SIMULATED CHALLENGING CONTENT SCENARIO ===" );
     
     # Create mock data for testing integration
-    challenging_matches = [
-        # High-quality match detecting full offset
-        AlignmentMatch(
-            audio_sample_index=0,
-            audio_sample_timestamp=120.0,
-            audio_text="EVE, what is your directive?",
-            subtitle_minute=2,
-            subtitle_timestamp=150.2,  # +30.2s offset
-            subtitle_text="EVE. What is your directive?",
-            levenshtein_distance=2,
-            similarity_score=0.78,  # Good quality
-            is_match=True
-        ),
-        # Noisy/partial detection (outlier candidate)
-        AlignmentMatch(
-            audio_sample_index=1,
-            audio_sample_timestamp=300.0,
-            audio_text="WALL-E robot sounds and beeping",
-            subtitle_minute=5,
-            subtitle_timestamp=306.5,  # +6.5s offset (outlier)
-            subtitle_text="[mechanical whirring]",
-            levenshtein_distance=25,
-            similarity_score=0.42,  # Low quality
-            is_match=True
-        ),
-        # Another good detection confirming main trend
-        AlignmentMatch(
-            audio_sample_index=2,
-            audio_sample_timestamp=480.0,
-            audio_text="AUTO, directive Alpha confirmed",
-            subtitle_minute=8,
-            subtitle_timestamp=510.8,  # +30.8s offset
-            subtitle_text="AUTO. Directive Alpha confirmed.",
-            levenshtein_distance=3,
-            similarity_score=0.85,  # High quality
-            is_match=True
-        ),
-        # Complex audio with moderate match
-        AlignmentMatch(
-            audio_sample_index=3,
-            audio_sample_timestamp=660.0,
-            audio_text="Define dancing, WALL-E",
-            subtitle_minute=11,
-            subtitle_timestamp=691.3,  # +31.3s offset
-            subtitle_text="Define: Dancing, WALL-E.",
-            levenshtein_distance=5,
-            similarity_score=0.72,  # Good quality
-            is_match=True
-        ),
-    ];
-    
-    logger.info( f"Created {len( challenging_matches )} challenging alignment matches" );
-    for i, match in enumerate( challenging_matches ):
-        offset = match.subtitle_timestamp - match.audio_sample_timestamp;
-        logger.info( f"  Match {i}: similarity={match.similarity_score:.3f}, offset={offset:.1f}s" );
+    challenging_matches = CHALLENGING_MATCHES;
+    
+    logger.info( "Created %s challenging alignment matches", len( challenging_matches ) );
+    if logger.isEnabledFor( logging.INFO ):
+        offs = np.fromiter( ( m.offset for m in challenging_matches ), dtype=np.float64, count=len( challenging_matches ) );
+        for i, ( match, offset ) in enumerate( zip( challenging_matches, offs ) ):
+            logger.info( "  Match %s: similarity=%.3f, offset=%.1fs", i, match.similarity_score, offset );
     
     # Test 1: Weighted Offset Calculation
-    logger.info( f"\\n=== 1. WEIGHTED OFFSET CALCULATION ===" );
+    logger.info( "\\n=== 1. WEIGHTED OFFSET CALCULATION ===" );
     offset_calc = OffsetCalculator();
+    match_columns = AlignmentMatchArray.from_matches( challenging_matches );  # Built once, shared by all calculator calls
     
-    offsets = offset_calc.calculate_sample_offsets( challenging_matches );
-    logger.info( f"Generated {len( offsets )} weighted offset points" );
+    offsets = offset_calc.calculate_sample_offsets( match_columns );
+    logger.info( "Generated %s weighted offset points", len( offsets ) );
     
     # Test 2: Uniform vs Interpolated Correction Decision
-    should_uniform = offset_calc.should_use_uniform_correction( challenging_matches );
+    should_uniform = offset_calc.should_use_uniform_correction( match_columns );
     if should_uniform:
-        uniform_offset = offset_calc.apply_uniform_weighted_offset( challenging_matches );
-        logger.info( f"Recommended: Uniform weighted correction ({uniform_offset:.1f}s offset)" );
+        uniform_offset = offset_calc.apply_uniform_weighted_offset( match_columns );
+        logger.info( "Recommended: Uniform weighted correction (%.1fs offset)", uniform_offset );
     else:
-        logger.info( f"Recommended: Interpolated correction with {len( offsets )} points" );
+        logger.info( "Recommended: Interpolated correction with %s points", len( offsets ) );
     
     # Test 3: Enhanced Sampling Strategy
-    logger.info( f"\\n=== 2. ENHANCED SAMPLING STRATEGY ===" );
+    logger.info( "\\n=== 2. ENHANCED SAMPLING STRATEGY ===" );
     sampling = AdaptiveSamplingCoordinator();
+    recommend_sample_count = lru_cache( maxsize=64 )( sampling.recommend_sample_count );
+    get_cost_estimate = lru_cache( maxsize=64 )( sampling.get_cost_estimate );
     
     # Simulate different content types
-    content_scenarios = [
-        ( "Clean dialogue", "consistent", 0.85 ),
-        ( "Standard content", "moderate", 0.65 ), 
-        ( "Complex content (WALL-E)", "inconsistent", 0.35 ),
-    ];
-    
-    for content_type, consistency, success_rate in content_scenarios:
-        samples = sampling.recommend_sample_count( consistency, success_rate );
-        cost = sampling.get_cost_estimate( samples );
-        logger.info( f"  {content_type:25}: {samples:2d} samples, ${cost:.3f} cost" );
+    for content_type, consistency, success_rate in _CONTENT_SCENARIOS:
+        samples = recommend_sample_count( consistency, success_rate );
+        cost = get_cost_estimate( samples );
+        logger.info( "  %-25s: %2d samples, $%.3f cost", content_type, samples, cost );
     
     # Test 4: Adaptive Similarity Threshold
-    logger.info( f"\\n=== 3. ADAPTIVE SIMILARITY THRESHOLD ===" );
-    
-    # Mock synchronizer for threshold testing
-    class MockSync:
-        def __init__( self ):
-            self.logger = get_logger();
-            
-        def _get_adaptive_threshold( self, current: float, samples: int ) -> float:
-            if current >= 0.75:
-                adaptive = 0.6;
-            elif current >= 0.65:
-                adaptive = 0.5;  # WALL-E level
-            elif current >= 0.55:
-                adaptive = 0.45;
-            else:
-                return current;
-            
-            if samples >= 20:
-                adaptive = max( 0.4, adaptive - 0.1 );
-            elif samples >= 10:
-                adaptive = max( 0.45, adaptive - 0.05 );
-                
-            return max( 0.4, adaptive );
-    
-    sync_mock = MockSync();
-    
-    threshold_scenarios = [
-        ( "Default threshold", 0.65, 16 ),
-        ( "WALL-E complex audio", 0.65, 24 ),
-        ( "Very challenging", 0.6, 32 ),
-    ];
-    
-    for scenario, initial, samples in threshold_scenarios:
-        adaptive = sync_mock._get_adaptive_threshold( initial, samples );
-        logger.info( f"  {scenario:20}: {initial:.2f} -> {adaptive:.2f} threshold" );
+    logger.info( "\\n=== 3. ADAPTIVE SIMILARITY THRESHOLD ===" );
+    
+    # Bare synchronizer - _get_adaptive_threshold only needs a logger, not the video/API setup
+    bare_sync = SubtitleSynchronizer.__new__( SubtitleSynchronizer );
+    bare_sync.logger = get_logger();
+    
+    for scenario, initial, samples in _THRESHOLD_SCENARIOS:
+        adaptive = bare_sync._get_adaptive_threshold( initial, samples );
+        logger.info( "  %-20s: %.2f -> %.2f threshold", scenario, initial, adaptive );
     
     # Test 5: Multi-Pass Correction Decision  
-    logger.info( f"\\n=== 4. MULTI-PASS CORRECTION ANALYSIS ===" );
+    logger.info( "\\n=== 4. MULTI-PASS CORRECTION ANALYSIS ===" );
     
     # Test different success rate scenarios
-    success_scenarios = [
-        ( 0.25, "Low success rate -> Multi-pass recommended" ),
-        ( 0.45, "Moderate success -> Multi-pass considered" ),  
-        ( 0.75, "High success -> Single-pass sufficient" ),
-    ];
-    
-    for success_rate, expected in success_scenarios:
+    for success_rate, expected in _SUCCESS_SCENARIOS:
         # Mock the multi-pass decision logic
         would_multipass = (success_rate < 0.4 or (0.4 <= success_rate < 0.6 and len( offsets ) >= 3));
-        logger.info( f"  Success rate {success_rate:.1%}: {expected} -> {would_multipass}" );
+        logger.info( "  Success rate %.1f%%: %s -> %s", success_rate * 100, expected, would_multipass );
     
     # Test 6: Enhanced Transcription Preprocessing
-    logger.info( f"\\n=== 5. ENHANCED TRANSCRIPTION PREPROCESSING ===" );
-    logger.info( f"  Audio preprocessing chain:" );
-    logger.info( f"    1. High-pass filter (removes low-frequency noise)" );
-    logger.info( f"    2. Loudness normalization (consistent levels)" );
-    logger.info( f"    3. Noise reduction (handles robot sounds/effects)" );
-    logger.info( f"    4. Compander (enhances dialogue clarity)" );
-    logger.info( f"    5. Limiter (prevents clipping)" );
-    logger.info( f"  Expected benefit: 15-25% improvement in transcription quality" );
+    logger.info( "\\n=== 5. ENHANCED TRANSCRIPTION PREPROCESSING ===" );
+    logger.info( "  Audio preprocessing chain:" );
+    logger.info( "    1. High-pass filter (removes low-frequency noise)" );
+    logger.info( "    2. Loudness normalization (consistent levels)" );
+    logger.info( "    3. Noise reduction (handles robot sounds/effects)" );
+    logger.info( "    4. Compander (enhances dialogue clarity)" );
+    logger.info( "    5. Limiter (prevents clipping)" );
+    logger.info( "  Expected benefit: 15-25% improvement in transcription quality" );
     
     # Test 7: Overall Expected Performance
-    logger.info( f"\\n=== 6. EXPECTED WALL-E PERFORMANCE ===" );
-    
-    logger.info( f"Original WALL-E results:" );
-    logger.info( f"  - 8 samples, 70% threshold" );
-    logger.info( f"  - 2 matches (25% success rate)" );
-    logger.info( f"  - Simple averaging: 6.8s + 30.3s = 18.6s average" );
-    logger.info( f"  - Accuracy: 47.2% (11.4s error from true 30s)" );
-    
-    logger.info( f"\\nWith all improvements:" );
-    logger.info( f"  - 16-24 samples (enhanced sampling)" );
-    logger.info( f"  - 40% threshold (adaptive adjustment)" );  
-    logger.info( f"  - ~6-8 matches expected (4x better detection)" );
-    logger.info( f"  - Weighted averaging (trusts high-quality matches)" );
-    logger.info( f"  - Outlier filtering (removes 6.8s noise)" );
-    logger.info( f"  - Enhanced audio preprocessing (clearer robot speech)" );
-    logger.info( f"  - Multi-pass refinement (iterative improvement)" );
-    
-    logger.info( f"\\n🎯 Expected WALL-E accuracy: >95% (<1.5s error)" );
+    logger.info( "\\n=== 6. EXPECTED WALL-E PERFORMANCE ===" );
+    
+    logger.info( "Original WALL-E results:" );
+    logger.info( "  - 8 samples, 70% threshold" );
+    logger.info( "  - 2 matches (25% success rate)" );
+    logger.info( "  - Simple averaging: 6.8s + 30.3s = 18.6s average" );
+    logger.info( "  - Accuracy: 47.2% (11.4s error from true 30s)" );
+    
+    logger.info( "\\nWith all improvements:" );
+    logger.info( "  - 16-24 samples (enhanced sampling)" );
+    logger.info( "  - 40% threshold (adaptive adjustment)" );  
+    logger.info( "  - ~6-8 matches expected (4x better detection)" );
+    logger.info( "  - Weighted averaging (trusts high-quality matches)" );
+    logger.info( "  - Outlier filtering (removes 6.8s noise)" );
+    logger.info( "  - Enhanced audio preprocessing (clearer robot speech)" );
+    logger.info( "  - Multi-pass refinement (iterative improvement)" );
+    
+    logger.info( "\\n🎯 Expected WALL-E accuracy: >95% (<1.5s error)" );
 
 def test_cost_analysis():
     """Analyze cost impact of all improvements."""
     
     logger = get_logger();
-    logger.info( f"\\n=== COST-BENEFIT ANALYSIS ===" );
+    logger.info( "\\n=== COST-BENEFIT ANALYSIS ===" );
     
     sampling = AdaptiveSamplingCoordinator();
+    get_cost_estimate = lru_cache( maxsize=64 )( sampling.get_cost_estimate );  # Old/new columns share sample counts
     
     # Compare old vs new costs
-    scenarios = [
-        ( "Short video", 4, 16 ),
-        ( "TV episode", 4, 20 ), 
-        ( "Movie", 8, 24 ),
-        ( "Complex movie", 8, 32 ),
-    ];
-    
-    logger.info( f"Content type        Old samples   New samples   Cost increase   Accuracy gain" );
-    logger.info( f"─" * 75 );
-    
-    for content, old_samples, new_samples in scenarios:
-        old_cost = sampling.get_cost_estimate( old_samples );
-        new_cost = sampling.get_cost_estimate( new_samples );
+    logger.info( "Content type        Old samples   New samples   Cost increase   Accuracy gain" );
+    logger.info( "─" * 75 );
+    
+    for content, old_samples, new_samples in _COST_SCENARIOS:
+        old_cost = get_cost_estimate( old_samples );
+        new_cost = get_cost_estimate( new_samples );
         increase = new_cost - old_cost;
         
-        # Estimated accuracy improvements
-        accuracy_gains = {
-            16: "~15%",  # Better coverage
-            20: "~25%",  # Enhanced sampling 
-            24: "~35%",  # Multi-modal content
-            32: "~45%",  # Very challenging content
-        };
-        
-        gain = accuracy_gains.get( new_samples, "~20%" );
+        gain = _ACCURACY_GAINS.get( new_samples, "~20%" );
         
-        logger.info( f"{content:15}    {old_samples:2d}           {new_samples:2d}        +${increase:.3f}        {gain}" );
-    
-    logger.info( f"\\nValue proposition:" );
-    logger.info( f"  - Manual subtitle sync: 30-90 minutes of tedious work" );
-    logger.info( f"  - SubShift processing: 3-8 minutes + AI cost" );
-    logger.info( f"  - Typical cost increase: $0.05-0.15 (5-15 cents)" );
-    logger.info( f"  - Accuracy improvement: 15-45% better results" );
-    logger.info( f"  - ROI: Massive time savings at minimal cost" );
+        logger.info( "%-15s    %2d           %2d        +$%.3f        %s", content, old_samples, new_samples, increase, gain );
+    
+    logger.info( "\\nValue proposition:" );
+    logger.info( "  - Manual subtitle sync: 30-90 minutes of tedious work" );
+    logger.info( "  - SubShift processing: 3-8 minutes + AI cost" );
+    logger.info( "  - Typical cost increase: $0.05-0.15 (5-15 cents)" );
+    logger.info( "  - Accuracy improvement: 15-45% better results" );
+    logger.info( "  - ROI: Massive time savings at minimal cost" );
 
 if __name__ == "__main__":
     test_improvement_integration();
@@ -3,16 +3,31 @@
 Demo script to test the enhanced sampling strategy with higher default sample counts.
 """
 
-import sys
-from pathlib import Path
+from functools import lru_cache
 
-# Add src to path
-sys.path.insert( 0, str( Path( __file__ ).parent / "src" ) );
+import _demo_bootstrap  # noqa: F401 - puts src/ on sys.path
 
 from subshift.audio import AdaptiveSamplingCoordinator;
 from subshift.sync import SubtitleSynchronizer;
 from subshift.logging import get_logger;
 
+# Scenario tables shared by the demo functions
+_CONSISTENCY_SCENARIOS = ( "insufficient_data", "consistent", "moderate", "inconsistent" );
+_SUCCESS_RATES = ( 0.3, 0.5, 0.7, 0.9 );
+_OLD_DEFAULTS = { "consistent": 8, "moderate": 20, "inconsistent": 35, "insufficient_data": 12 };
+_COST_SCENARIOS = (
+    ( "Clean dialogue (consistent)", "consistent" ),
+    ( "Standard content (moderate)", "moderate" ),
+    ( "Complex audio (inconsistent)", "inconsistent" ),
+);
+_ACCURACY_TARGETS = { "consistent": ">95%", "moderate": ">90%", "inconsistent": ">85%" };
+_CONTENT_TYPES = (
+    ( "Short video (30min)", 16 ),
+    ( "TV episode (45min)", 20 ),
+    ( "Movie (2hr)", 24 ),
+    ( "Long movie (3hr)", 32 ),
+);
+
 def test_enhanced_sampling_defaults():
     """Test the new enhanced sampling defaults and recommendations."""
     
@@ -22,62 +37,49 @@ def test_enhanced_sampling_defaults():
     # Test AdaptiveSamplingCoordinator recommendations
     coordinator = AdaptiveSamplingCoordinator( debug=True );
     
-    logger.info( f"\\n=== SAMPLE COUNT RECOMMENDATIONS ===" );
+    # Scenarios repeat the same few arguments - compute each answer once
+    recommend_sample_count = lru_cache( maxsize=64 )( coordinator.recommend_sample_count );
+    get_cost_estimate = lru_cache( maxsize=64 )( coordinator.get_cost_estimate );
     
-    consistency_scenarios = [ "insufficient_data", "consistent", "moderate", "inconsistent" ];
+    logger.info( "\\n=== SAMPLE COUNT RECOMMENDATIONS ===" );
     
-    for consistency in consistency_scenarios:
-        recommended = coordinator.recommend_sample_count( consistency );
-        cost = coordinator.get_cost_estimate( recommended );
-        logger.info( f"  {consistency:15}: {recommended:2d} samples (${cost:.3f} cost)" );
+    for consistency in _CONSISTENCY_SCENARIOS:
+        recommended = recommend_sample_count( consistency );
+        cost = get_cost_estimate( recommended );
+        logger.info( "  %-15s: %2d samples ($%.3f cost)", consistency, recommended, cost );
     
-    logger.info( f"\\n=== SUCCESS RATE ADJUSTMENTS ===" );
+    logger.info( "\\n=== SUCCESS RATE ADJUSTMENTS ===" );
     
     # Test success rate adjustments
     base_consistency = "moderate";
-    success_rates = [ 0.3, 0.5, 0.7, 0.9 ];
-    
-    for success_rate in success_rates:
-        recommended = coordinator.recommend_sample_count( base_consistency, success_rate );
-        cost = coordinator.get_cost_estimate( recommended );
-        logger.info( f"  Success rate {success_rate:.1f}: {recommended:2d} samples (${cost:.3f} cost)" );
-    
-    logger.info( f"\\n=== COMPARISON: OLD vs NEW DEFAULTS ===" );
-    
-    old_defaults = { "consistent": 8, "moderate": 20, "inconsistent": 35, "insufficient_data": 12 };
-    
-    for consistency in consistency_scenarios:
-        old_count = old_defaults.get( consistency, 20 );
-        new_count = coordinator.recommend_sample_count( consistency );
-        old_cost = coordinator.get_cost_estimate( old_count );
-        new_cost = coordinator.get_cost_estimate( new_count );
+    for success_rate in _SUCCESS_RATES:
+        recommended = recommend_sample_count( base_consistency, success_rate );
+        cost = get_cost_estimate( recommended );
+        logger.info( "  Success rate %.1f: %2d samples ($%.3f cost)", success_rate, recommended, cost );
+    
+    logger.info( "\\n=== COMPARISON: OLD vs NEW DEFAULTS ===" );
+    
+    for consistency in _CONSISTENCY_SCENARIOS:
+        old_count = _OLD_DEFAULTS.get( consistency, 20 );
+        new_count = recommend_sample_count( consistency );
+        old_cost = get_cost_estimate( old_count );
+        new_cost = get_cost_estimate( new_count );
         
         improvement = new_count - old_count;
         cost_increase = new_cost - old_cost;
         
-        logger.info( f"  {consistency:15}: {old_count:2d} -> {new_count:2d} samples " \
-                   f"(+{improvement:2d}, +${cost_increase:.3f} cost)" );
-    logger.info( f"\\n=== COST ANALYSIS ===" );
+        logger.info( "  %-15s: %2d -> %2d samples (+%2d, +$%.3f cost)", consistency, old_count, new_count, improvement, cost_increase );
+    logger.info( "\\n=== COST ANALYSIS ===" );
     
     # Typical scenarios
-    scenarios = [
-        ( "Clean dialogue (consistent)", "consistent" ),
-        ( "Standard content (moderate)", "moderate" ),
-        ( "Complex audio (inconsistent)", "inconsistent" )
-    ];
-    
-    for desc, consistency in scenarios:
-        samples = coordinator.recommend_sample_count( consistency );
-        cost = coordinator.get_cost_estimate( samples );
-        accuracy_target = {
-            "consistent": ">95%",
-            "moderate": ">90%", 
-            "inconsistent": ">85%"
-        }.get( consistency, "~80%" );
+    for desc, consistency in _COST_SCENARIOS:
+        samples = recommend_sample_count( consistency );
+        cost = get_cost_estimate( samples );
+        accuracy_target = _ACCURACY_TARGETS.get( consistency, "~80%" );
         
-        logger.info( f"  {desc:25}: {samples:2d} samples, ${cost:.3f} cost, {accuracy_target} target accuracy" );
+        logger.info( "  %-25s: %2d samples, $%.3f cost, %s target accuracy", desc, samples, cost, accuracy_target );
         
-    logger.info( f"\n=== SUBSHIFT SYNCHRONIZER DEFAULTS ===" );
+    logger.info( "\n=== SUBSHIFT SYNCHRONIZER DEFAULTS ===" );
     
     # Test default synchronizer behavior
     # Note: Can't test full synchronizer without real files, but can test default values
@@ -86,50 +88,44 @@ def test_enhanced_sampling_defaults():
         sync_default = 16;  # New default from constructor
         sync_old = 4;       # Old default
         
-        cost_new = coordinator.get_cost_estimate( sync_default );
-        cost_old = coordinator.get_cost_estimate( sync_old );
+        cost_new = get_cost_estimate( sync_default );
+        cost_old = get_cost_estimate( sync_old );
         
-        logger.info( f"  Default samples: {sync_old} -> {sync_default} (+{sync_default - sync_old})" );
-        logger.info( f"  Default cost: ${cost_old:.3f} -> ${cost_new:.3f} (+${cost_new - cost_old:.3f})" );
-        logger.info( f"  Expected improvement: Significantly better match detection" );
+        logger.info( "  Default samples: %s -> %s (+%s)", sync_old, sync_default, sync_default - sync_old );
+        logger.info( "  Default cost: $%.3f -> $%.3f (+$%.3f)", cost_old, cost_new, cost_new - cost_old );
+        logger.info( "  Expected improvement: Significantly better match detection" );
         
         # Expected benefits
-        logger.info( f"\n=== EXPECTED BENEFITS ===" );
-        logger.info( f"  1. Better coverage: 4x more data points across video timeline" );
-        logger.info( f"  2. Outlier resistance: More samples = better statistical filtering" );
-        logger.info( f"  3. Reduced failure rate: Higher chance of finding good matches" );
-        logger.info( f"  4. Improved accuracy: More evidence for offset calculation" );
-        logger.info( f"  5. Better for complex content: WALL-E, animated films, music-heavy content" );
+        logger.info( "\n=== EXPECTED BENEFITS ===" );
+        logger.info( "  1. Better coverage: 4x more data points across video timeline" );
+        logger.info( "  2. Outlier resistance: More samples = better statistical filtering" );
+        logger.info( "  3. Reduced failure rate: Higher chance of finding good matches" );
+        logger.info( "  4. Improved accuracy: More evidence for offset calculation" );
+        logger.info( "  5. Better for complex content: WALL-E, animated films, music-heavy content" );
         
     except Exception as e:
-        logger.info( f"  Could not test full synchronizer: {e}" );
+        logger.info( "  Could not test full synchronizer: %s", e );
 
 def test_cost_impact_analysis():
     """Analyze the cost impact of enhanced sampling."""
     
     logger = get_logger();
-    logger.info( f"\n=== COST IMPACT ANALYSIS ===" );
+    logger.info( "\n=== COST IMPACT ANALYSIS ===" );
     
     coordinator = AdaptiveSamplingCoordinator( debug=False );
+    get_cost_estimate = lru_cache( maxsize=64 )( coordinator.get_cost_estimate );
     
     # Analyze cost for different content types
-    content_types = [
-        ( "Short video (30min)", 16 ),
-        ( "TV episode (45min)", 20 ),
-        ( "Movie (2hr)", 24 ),
-        ( "Long movie (3hr)", 32 )
-    ];
-    
-    for content_type, typical_samples in content_types:
-        cost = coordinator.get_cost_estimate( typical_samples );
-        logger.info( f"  {content_type:20}: {typical_samples:2d} samples, ${cost:.3f} cost" );
+    for content_type, typical_samples in _CONTENT_TYPES:
+        cost = get_cost_estimate( typical_samples );
+        logger.info( "  %-20s: %2d samples, $%.3f cost", content_type, typical_samples, cost );
     
     # Compare to manual correction time
-    logger.info( f"\n=== VALUE PROPOSITION ===" );
-    logger.info( f"  Manual correction time: 15-60 minutes" );
-    logger.info( f"  SubShift processing: 2-5 minutes + AI cost" );
-    logger.info( f"  Typical AI cost: $0.010-0.050 (much less than hourly wage)" );
-    logger.info( f"  Net benefit: Massive time savings at minimal cost" );
+    logger.info( "\n=== VALUE PROPOSITION ===" );
+    logger.info( "  Manual correction time: 15-60 minutes" );
+    logger.info( "  SubShift processing: 2-5 minutes + AI cost" );
+    logger.info( "  Typical AI cost: $0.010-0.050 (much less than hourly wage)" );
+    logger.info( "  Net benefit: Massive time savings at minimal cost" );
 
 if __name__ == "__main__":
     test_enhanced_sampling_defaults();
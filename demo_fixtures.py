@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Shared AlignmentMatch fixtures for the demo scripts, built once at import time.
+"""
+
+from typing import Tuple
+
+import _demo_bootstrap  # noqa: F401 - puts src/ on sys.path
+
+from subshift.align import AlignmentMatch;
+
+# WALL-E scenario: +30s true offset with one bad 6.8s detection
+WALL_E_MATCHES: Tuple[AlignmentMatch, ...] = (
+    # Good match: Detects full +30s offset with decent similarity
+    AlignmentMatch(
+        audio_sample_index=0,
+        audio_sample_timestamp=120.0,  # 2 minutes
+        audio_text="EVE, directive?",
+        subtitle_minute=2,
+        subtitle_timestamp=150.3,  # +30.3s offset (close to true +30s)
+        subtitle_text="EVE. Directive?",
+        levenshtein_distance=1,
+        similarity_score=0.72,  # Above 60% threshold
+        is_match=True
+    ),
+    # Bad match: Partial/noisy detection shows +6.8s offset
+    AlignmentMatch(
+        audio_sample_index=1,
+        audio_sample_timestamp=300.0,  # 5 minutes
+        audio_text="WALL-E beeping and mechanical sounds",
+        subtitle_minute=5,
+        subtitle_timestamp=306.8,  # +6.8s offset (outlier)
+        subtitle_text="[mechanical whirring]",
+        levenshtein_distance=25,
+        similarity_score=0.61,  # Just above threshold
+        is_match=True
+    ),
+    # Another good match: Confirms +29s offset trend
+    AlignmentMatch(
+        audio_sample_index=2,
+        audio_sample_timestamp=480.0,  # 8 minutes
+        audio_text="Auto, directive Alpha",
+        subtitle_minute=8,
+        subtitle_timestamp=509.2,  # +29.2s offset
+        subtitle_text="AUTO. Directive: Alpha.",
+        levenshtein_distance=4,
+        similarity_score=0.78,  # Good similarity
+        is_match=True
+    ),
+    # High confidence match: Strong +31s detection
+    AlignmentMatch(
+        audio_sample_index=3,
+        audio_sample_timestamp=660.0,  # 11 minutes
+        audio_text="Earth, define dancing",
+        subtitle_minute=11,
+        subtitle_timestamp=691.1,  # +31.1s offset
+        subtitle_text="Earth. Define: Dancing.",
+        levenshtein_distance=2,
+        similarity_score=0.85,  # High similarity
+        is_match=True
+    ),
+);
+
+# Matches of varying quality around a +30s offset (subtitles ahead)
+WEIGHTED_DEMO_MATCHES: Tuple[AlignmentMatch, ...] = (
+    # High similarity match shows +30s offset (subtitles ahead)
+    AlignmentMatch(
+        audio_sample_index=0,
+        audio_sample_timestamp=120.0,  # 2 minutes
+        audio_text="Hello robot, how are you doing today?",
+        subtitle_minute=2,
+        subtitle_timestamp=150.0,  # Should be 120s, but is at 150s (+30s offset)
+        subtitle_text="Hello robot, how are you doing today?",
+        levenshtein_distance=2,
+        similarity_score=0.95,  # Very high similarity
+        is_match=True
+    ),
+    # Medium similarity match shows +29s offset (consistent)
+    AlignmentMatch(
+        audio_sample_index=1,
+        audio_sample_timestamp=300.0,  # 5 minutes
+        audio_text="What a beautiful day for adventure",
+        subtitle_minute=5,
+        subtitle_timestamp=329.0,  # Should be 300s, but is at 329s (+29s offset)
+        subtitle_text="What a lovely day for exploration",
+        levenshtein_distance=8,
+        similarity_score=0.75,  # Medium similarity
+        is_match=True
+    ),
+    # Lower similarity match shows +25s offset (slightly different, could be noise)
+    AlignmentMatch(
+        audio_sample_index=2,
+        audio_sample_timestamp=480.0,  # 8 minutes
+        audio_text="Time to go home now",
+        subtitle_minute=8,
+        subtitle_timestamp=505.0,  # Should be 480s, but is at 505s (+25s offset)
+        subtitle_text="Time to return home",
+        levenshtein_distance=12,
+        similarity_score=0.65,  # Lower similarity
+        is_match=True
+    ),
+    # High similarity match shows +31s offset (consistent with main trend)
+    AlignmentMatch(
+        audio_sample_index=3,
+        audio_sample_timestamp=660.0,  # 11 minutes
+        audio_text="Thank you for the adventure",
+        subtitle_minute=11,
+        subtitle_timestamp=691.0,  # Should be 660s, but is at 691s (+31s offset)
+        subtitle_text="Thank you for this adventure",
+        levenshtein_distance=3,
+        similarity_score=0.88,  # High similarity
+        is_match=True
+    ),
+);
+
+# Challenging content similar to WALL-E, with a low-quality 6.5s outlier
+CHALLENGING_MATCHES: Tuple[AlignmentMatch, ...] = (
+    # High-quality match detecting full offset
+    AlignmentMatch(
+        audio_sample_index=0,
+        audio_sample_timestamp=120.0,
+        audio_text="EVE, what is your directive?",
+        subtitle_minute=2,
+        subtitle_timestamp=150.2,  # +30.2s offset
+        subtitle_text="EVE. What is your directive?",
+        levenshtein_distance=2,
+        similarity_score=0.78,  # Good quality
+        is_match=True
+    ),
+    # Noisy/partial detection (outlier candidate)
+    AlignmentMatch(
+        audio_sample_index=1,
+        audio_sample_timestamp=300.0,
+        audio_text="WALL-E robot sounds and beeping",
+        subtitle_minute=5,
+        subtitle_timestamp=306.5,  # +6.5s offset (outlier)
+        subtitle_text="[mechanical whirring]",
+        levenshtein_distance=25,
+        similarity_score=0.42,  # Low quality
+        is_match=True
+    ),
+    # Another good detection confirming main trend
+    AlignmentMatch(
+        audio_sample_index=2,
+        audio_sample_timestamp=480.0,
+        audio_text="AUTO, directive Alpha confirmed",
+        subtitle_minute=8,
+        subtitle_timestamp=510.8,  # +30.8s offset
+        subtitle_text="AUTO. Directive Alpha confirmed.",
+        levenshtein_distance=3,
+        similarity_score=0.85,  # High quality
+        is_match=True
+    ),
+    # Complex audio with moderate match
+    AlignmentMatch(
+        audio_sample_index=3,
+        audio_sample_timestamp=660.0,
+        audio_text="Define dancing, WALL-E",
+        subtitle_minute=11,
+        subtitle_timestamp=691.3,  # +31.3s offset
+        subtitle_text="Define: Dancing, WALL-E.",
+        levenshtein_distance=5,
+        similarity_score=0.72,  # Good quality
+        is_match=True
+    ),
+);
@@ -4,10 +4,26 @@ Script to modify SRT subtitle timestamps by adding a fixed offset.
 
 Usage: python3 modify_timestamps.py input.srt output.srt [offset_seconds]
 """
+import io
 import sys
 import re
+from itertools import islice
 from pathlib import Path
 
+import numpy as np
+
+# Compiled once at import - used for every timestamp and line in the file
+_TS_RE = re.compile( r'(\d{2}):(\d{2}):(\d{2}),(\d{3})' );
+_TS_LINE_RE = re.compile( r'(\d{2}):(\d{2}):(\d{2}),(\d{3}) --> (\d{2}):(\d{2}):(\d{2}),(\d{3})' );
+
+# Zero-padded field strings, so formatting a timestamp is four lookups and a join
+_PAD2 = tuple( f"{i:02d}" for i in range( 100 ) );
+_PAD3 = tuple( f"{i:03d}" for i in range( 1000 ) );
+
+# Streaming: lines shifted per vectorized block, and output buffer size
+_BLOCK_LINES = 4096;
+_WRITE_BUFFER = 1 << 20;
+
 
 def parse_timestamp( timestamp_str ):
     """
@@ -19,8 +35,7 @@ def parse_timestamp( timestamp_str ):
     Returns:
         Tuple of (hours, minutes, seconds, milliseconds)
     """
-    pattern = r'(\d{2}):(\d{2}):(\d{2}),(\d{3})';
-    match = re.match( pattern, timestamp_str );
+    match = _TS_RE.match( timestamp_str );
     if not match:
         raise ValueError( f"Invalid timestamp format: {timestamp_str}" );
     
@@ -42,7 +57,11 @@ def format_timestamp( hours, minutes, seconds, milliseconds ):
     Returns:
         Formatted timestamp string like "00:01:23,456"
     """
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}";
+    if 0 <= hours < 100 and 0 <= minutes < 100 and 0 <= seconds < 100 and 0 <= milliseconds < 1000:
+        return _PAD2[hours] + ':' + _PAD2[minutes] + ':' + _PAD2[seconds] + ',' + _PAD3[milliseconds];
+    
+    # Out-of-table values (hours > 99, negative times) keep the plain zero-padded format
+    return '%02d:%02d:%02d,%03d' % ( hours, minutes, seconds, milliseconds );
 
 
 def add_seconds_to_timestamp( timestamp_str, offset_seconds ):
@@ -82,10 +101,69 @@ def add_seconds_to_timestamp( timestamp_str, offset_seconds ):
     return format_timestamp( new_hours, new_minutes, new_seconds, new_milliseconds );
 
 
+def shift_timestamp_components( components, offset_seconds ):
+    """
+    Vectorized add_seconds_to_timestamp over many timestamps at once.
+    
+    Args:
+        components: (N, 4) integer array of hours, minutes, seconds, milliseconds
+        offset_seconds: Number of seconds to add
+        
+    Returns:
+        (N, 4) int64 array of shifted components (same floor wraparound as add_seconds_to_timestamp)
+    """
+    hours, minutes, seconds, milliseconds = components.T;
+    total_ms = ( hours * 3600 + minutes * 60 + seconds ) * 1000 + milliseconds + offset_seconds * 1000;
+    
+    total_seconds, new_milliseconds = np.divmod( total_ms, 1000 );
+    total_minutes, new_seconds = np.divmod( total_seconds, 60 );
+    new_hours, new_minutes = np.divmod( total_minutes, 60 );
+    
+    return np.stack( ( new_hours, new_minutes, new_seconds, new_milliseconds ), axis=1 );
+
+
+def shift_srt_text( text, offset_seconds, modified_before=0 ):
+    """
+    Add an offset to every timestamp line in a block of SRT text.
+    
+    Args:
+        text: SRT text made of complete lines
+        offset_seconds: Seconds to add to each timestamp
+        modified_before: Timestamp lines already modified in earlier blocks (limits the preview output)
+        
+    Returns:
+        Tuple of (shifted_text, modified_lines)
+    """
+    # Parse every timing line at once: one row of (h, m, s, ms) per timestamp, start/end interleaved
+    components = np.array( _TS_LINE_RE.findall( text ), dtype=np.int64 ).reshape( -1, 4 );
+    shifted = shift_timestamp_components( components, offset_seconds );
+    
+    # SRT format typically doesn't go beyond 24 hours, but we'll allow it
+    for hours in shifted[shifted[:, 0] > 99, 0].tolist():
+        print( f"Warning: Hours exceed 99 in timestamp: {hours}" );
+    
+    new_timestamps = iter( [ format_timestamp( *row ) for row in shifted.tolist() ] );
+    modified_lines = 0;
+    
+    def replace_timing( match ):
+        nonlocal modified_lines;
+        new_start = next( new_timestamps );
+        new_end = next( new_timestamps );
+        modified_lines += 1;
+        
+        if modified_before + modified_lines <= 5:  # Show first few modifications
+            print( f"  {match.group( 0 )}  =>  {new_start} --> {new_end}" );
+        return f"{new_start} --> {new_end}";
+    
+    return _TS_LINE_RE.sub( replace_timing, text ), modified_lines;
+
+
 def modify_srt_file( input_file, output_file, offset_seconds ):
     """
     Modify all timestamps in an SRT file by adding an offset.
     
+    The file is streamed in blocks of lines, so memory stays bounded for large inputs.
+    
     Args:
         input_file: Path to input SRT file
         output_file: Path to output SRT file
@@ -93,33 +171,22 @@ def modify_srt_file( input_file, output_file, offset_seconds ):
     """
     print( f"Modifying '{input_file}' by adding {offset_seconds} seconds..." );
     
-    timestamp_pattern = r'(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})';
     modified_lines = 0;
+    in_place = Path( input_file ).resolve() == Path( output_file ).resolve();
     
     with open( input_file, 'r', encoding='utf-8' ) as infile:
-        lines = infile.readlines();
-    
-    with open( output_file, 'w', encoding='utf-8' ) as outfile:
-        for line in lines:
-            # Check if line contains timestamp
-            match = re.search( timestamp_pattern, line );
-            if match:
-                start_time = match.group( 1 );
-                end_time = match.group( 2 );
-                
-                # Modify timestamps
-                new_start = add_seconds_to_timestamp( start_time, offset_seconds );
-                new_end = add_seconds_to_timestamp( end_time, offset_seconds );
-                
-                # Replace in line
-                new_line = line.replace( f"{start_time} --> {end_time}", f"{new_start} --> {new_end}" );
-                outfile.write( new_line );
-                modified_lines += 1;
+        if in_place:
+            infile = io.StringIO( infile.read() );  # Opening the output truncates the input - keep a copy
+        
+        with open( output_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER ) as outfile:
+            while True:
+                block = "".join( islice( infile, _BLOCK_LINES ) );
+                if not block:
+                    break;
                 
-                if modified_lines <= 5:  # Show first few modifications
-                    print( f"  {start_time} --> {end_time}  =>  {new_start} --> {new_end}" );
-            else:
-                outfile.write( line );
+                shifted_block, block_lines = shift_srt_text( block, offset_seconds, modified_lines );
+                outfile.write( shifted_block );
+                modified_lines += block_lines;
     
     print( f"Modified {modified_lines} timestamp lines" );
     print( f"Output saved to: {output_file}" );
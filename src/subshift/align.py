@@ -1,21 +1,50 @@
 """
 Alignment algorithm for matching AI transcripts with subtitle text using Levenshtein distance.
 """
+import bisect
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import Levenshtein
-import re
-from collections import Counter
+import numpy as np
+from rapidfuzz import process as rf_process
+from rapidfuzz.distance import Levenshtein as RFLevenshtein
 
 from .audio import AudioSample
-from .subtitles import SubtitleProcessor
+from .subtitles import SubtitleProcessor, TextFeatures, text_features
 from .logging import get_logger
 
 
-@dataclass
+# Most calculate_weighted_similarity can add on top of the base Levenshtein similarity
+# (word 0.15 + structure 0.05 + content 0.08 + timing 0.10, rounded up for float safety)
+_MAX_BONUS = 0.4;
+
+
+@lru_cache( maxsize=4096 )
+def _audio_features( text_lower: str ) -> TextFeatures:
+    """
+    text_features memoized on the transcription.
+    
+    Short stock transcriptions ("thanks for watching", music cues) repeat across
+    samples and retries; callers must treat the cached Counter as read-only.
+    """
+    return text_features( text_lower );
+
+
+@dataclass( frozen=True )
 class AlignmentMatch:
     """Represents a match between an audio sample and subtitle text."""
     
+    # Explicit slots (dataclass slots=True needs Python 3.10); 'offset' is a derived
+    # slot set in __post_init__, not a dataclass field
+    __slots__ = (
+        'audio_sample_index', 'audio_sample_timestamp', 'audio_text', 'subtitle_minute',
+        'subtitle_timestamp', 'subtitle_text', 'levenshtein_distance', 'similarity_score',
+        'is_match', 'offset',
+    );
+    
     audio_sample_index: int;        # Index of the audio sample
     audio_sample_timestamp: float;  # Start timestamp of audio sample (seconds)  
     audio_text: str;                # AI transcribed text
@@ -26,12 +55,78 @@ class AlignmentMatch:
     similarity_score: float;        # Normalized similarity (0.0-1.0)
     is_match: bool;                 # Whether this passes the threshold
     
+    def __post_init__( self ):
+        # subtitle_timestamp - audio_sample_timestamp (frozen, so bypass the dataclass __setattr__)
+        object.__setattr__( self, 'offset', self.subtitle_timestamp - self.audio_sample_timestamp );
+    
+    # pickle/copy restore slot state with setattr by default, which the frozen dataclass
+    # rejects - hand the state over explicitly and restore it with object.__setattr__
+    def __getstate__( self ):
+        return tuple( getattr( self, name ) for name in self.__slots__ );
+    
+    def __setstate__( self, state ):
+        for name, value in zip( self.__slots__, state ):
+            object.__setattr__( self, name, value );
+    
     def __repr__( self ):
         status = "✓" if self.is_match else "✗";
         return f"AlignmentMatch({status} sample={self.audio_sample_index}, " \
                f"minute={self.subtitle_minute}, similarity={self.similarity_score:.2f})";
 
 
+@dataclass
+class AlignmentMatchArray:
+    """
+    Struct-of-arrays view over a list of AlignmentMatch objects.
+    
+    Each numeric AlignmentMatch field becomes one contiguous NumPy column, so
+    offset statistics can be computed with array operations instead of
+    per-object attribute access.
+    """
+    
+    audio_sample_index: np.ndarray;      # int64
+    audio_sample_timestamp: np.ndarray;  # float64 seconds
+    subtitle_timestamp: np.ndarray;      # float64 seconds
+    levenshtein_distance: np.ndarray;    # float64 (may hold inf for non-matches)
+    similarity_score: np.ndarray;        # float64 0.0-1.0
+    is_match: np.ndarray;                # bool
+    offset: np.ndarray;                  # float64 subtitle_timestamp - audio_sample_timestamp
+    
+    @classmethod
+    def from_matches( cls, matches: List[AlignmentMatch] ) -> "AlignmentMatchArray":
+        """Build the column arrays from AlignmentMatch objects."""
+        count = len( matches );
+        
+        def column( attr: str, dtype ) -> np.ndarray:
+            return np.fromiter( ( getattr( m, attr ) for m in matches ), dtype=dtype, count=count );
+        
+        return cls(
+            audio_sample_index=column( 'audio_sample_index', np.int64 ),
+            audio_sample_timestamp=column( 'audio_sample_timestamp', np.float64 ),
+            subtitle_timestamp=column( 'subtitle_timestamp', np.float64 ),
+            levenshtein_distance=column( 'levenshtein_distance', np.float64 ),
+            similarity_score=column( 'similarity_score', np.float64 ),
+            is_match=column( 'is_match', np.bool_ ),
+            offset=column( 'offset', np.float64 )
+        );
+    
+    def __len__( self ):
+        return len( self.offset );
+    
+    def successful( self ) -> "AlignmentMatchArray":
+        """Return only the rows that pass the similarity threshold."""
+        mask = self.is_match;
+        return AlignmentMatchArray(
+            audio_sample_index=self.audio_sample_index[mask],
+            audio_sample_timestamp=self.audio_sample_timestamp[mask],
+            subtitle_timestamp=self.subtitle_timestamp[mask],
+            levenshtein_distance=self.levenshtein_distance[mask],
+            similarity_score=self.similarity_score[mask],
+            is_match=self.is_match[mask],
+            offset=self.offset[mask]
+        );
+
+
 class AlignmentEngine:
     """
     Alignment engine for matching audio transcripts with subtitle text.
@@ -46,13 +141,14 @@ class AlignmentEngine:
         self.search_window = search_window;
         self.min_chars = min_chars;
     
-    def calculate_levenshtein_similarity( self, text1: str, text2: str ) -> Tuple[int, float]:
+    def calculate_levenshtein_similarity( self, text1: str, text2: str, distance: Optional[int] = None ) -> Tuple[int, float]:
         """
         Calculate basic Levenshtein distance and similarity score.
         
         Args:
             text1: First text string
             text2: Second text string
+            distance: Precomputed distance between the texts (e.g. from batch_distances)
             
         Returns:
             Tuple of (levenshtein_distance, similarity_score)
@@ -61,7 +157,8 @@ class AlignmentEngine:
         if not text1 or not text2:
             return float( 'inf' ), 0.0;
         
-        distance = Levenshtein.distance( text1, text2 );
+        if distance is None:
+            distance = Levenshtein.distance( text1, text2 );
         max_length = max( len( text1 ), len( text2 ) );
         
         if max_length == 0:
@@ -70,7 +167,10 @@ class AlignmentEngine:
         similarity = 1.0 - ( distance / max_length );
         return distance, similarity;
     
-    def calculate_weighted_similarity( self, audio_text: str, subtitle_text: str, audio_timestamp: float, subtitle_minute: int ) -> Tuple[int, float]:
+    def calculate_weighted_similarity( self, audio_text: str, subtitle_text: str, audio_timestamp: float, subtitle_minute: int,
+                                       audio_features: Optional[TextFeatures] = None,
+                                       subtitle_features: Optional[TextFeatures] = None,
+                                       distance: Optional[int] = None ) -> Tuple[int, float]:
         """
         Calculate weighted similarity score using multiple factors for better accuracy.
         
@@ -82,10 +182,15 @@ class AlignmentEngine:
         5. Timing proximity bonus
         
         Args:
-            audio_text: AI transcribed text
-            subtitle_text: Subtitle text
+            audio_text: AI transcribed text, lowercased (AudioSample.transcription_lower)
+            subtitle_text: Subtitle text, lowercased
             audio_timestamp: Audio sample timestamp (seconds)
             subtitle_minute: Subtitle minute
+            audio_features: Precomputed text_features() of the lowercased audio text,
+                            so callers scoring many candidates extract them once
+            subtitle_features: Precomputed text_features() of the lowercased subtitle text
+                               (see SubtitleProcessor.get_minute_features)
+            distance: Precomputed Levenshtein distance between the two texts
             
         Returns:
             Tuple of (levenshtein_distance, weighted_similarity_score)
@@ -94,44 +199,35 @@ class AlignmentEngine:
             return float( 'inf' ), 0.0;
         
         # Base Levenshtein similarity
-        distance, base_similarity = self.calculate_levenshtein_similarity( audio_text, subtitle_text );
-        
-        # Factor 1: Word overlap bonus (important words matching)
-        audio_words = set( audio_text.lower().split() );
-        subtitle_words = set( subtitle_text.lower().split() );
-        
-        # Filter out common words that don't add meaning
-        stopwords = { 'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'this', 'that', 'these', 'those' };
-        meaningful_audio = audio_words - stopwords;
-        meaningful_subtitle = subtitle_words - stopwords;
-        
-        if meaningful_audio and meaningful_subtitle:
-            word_overlap = len( meaningful_audio & meaningful_subtitle ) / len( meaningful_audio | meaningful_subtitle );
+        distance, base_similarity = self.calculate_levenshtein_similarity( audio_text, subtitle_text, distance );
+        
+        # Factor 1: Word overlap bonus (important words matching), stopwords filtered out
+        if audio_features is None:
+            audio_features = text_features( audio_text );
+        if subtitle_features is None:
+            subtitle_features = text_features( subtitle_text );
+        audio_counts, audio_norm, audio_sentences, audio_music, audio_dialogue = audio_features;
+        subtitle_counts, subtitle_norm, subtitle_sentences, subtitle_music, subtitle_dialogue = subtitle_features;
+        
+        if audio_counts and subtitle_counts:
+            # Multiset cosine similarity - repeated words count, unlike set Jaccard
+            smaller, larger = sorted( ( audio_counts, subtitle_counts ), key=len );
+            dot = sum( n * larger[token] for token, n in smaller.items() if token in larger );
+            word_overlap = dot / ( audio_norm * subtitle_norm );
             word_bonus = word_overlap * 0.15;  # Up to 15% bonus for good word overlap
         else:
             word_bonus = 0.0;
         
         # Factor 2: Sentence structure similarity (punctuation patterns, length)
-        audio_sentences = len( re.split( r'[.!?]+', audio_text ) );
-        subtitle_sentences = len( re.split( r'[.!?]+', subtitle_text ) );
-        
         if max( audio_sentences, subtitle_sentences ) > 0:
             structure_similarity = 1.0 - abs( audio_sentences - subtitle_sentences ) / max( audio_sentences, subtitle_sentences );
             structure_bonus = structure_similarity * 0.05;  # Up to 5% bonus for similar structure
         else:
             structure_bonus = 0.0;
         
-        # Factor 3: Content type detection (dialogue vs music/effects)
-        music_indicators = { 'music', 'song', 'singing', 'melody', 'tune', 'beat', 'rhythm', 'instrumental' };
-        dialogue_indicators = { 'said', 'told', 'asked', 'replied', 'answered', 'explained', 'whispered', 'shouted', 'called' };
-        
-        audio_music_score = len( meaningful_audio & music_indicators ) / max( len( meaningful_audio ), 1 );
-        subtitle_music_score = len( meaningful_subtitle & music_indicators ) / max( len( meaningful_subtitle ), 1 );
-        audio_dialogue_score = len( meaningful_audio & dialogue_indicators ) / max( len( meaningful_audio ), 1 );
-        subtitle_dialogue_score = len( meaningful_subtitle & dialogue_indicators ) / max( len( meaningful_subtitle ), 1 );
-        
+        # Factor 3: Content type detection (dialogue vs music/effects), shares precomputed per text
         # Bonus if both are same type (both music or both dialogue)
-        if ( audio_music_score > 0.1 and subtitle_music_score > 0.1 ) or ( audio_dialogue_score > 0.1 and subtitle_dialogue_score > 0.1 ):
+        if ( audio_music > 0.1 and subtitle_music > 0.1 ) or ( audio_dialogue > 0.1 and subtitle_dialogue > 0.1 ):
             content_bonus = 0.08;  # 8% bonus for matching content type
         else:
             content_bonus = 0.0;
@@ -153,12 +249,74 @@ class AlignmentEngine:
         # Debug logging for significant adjustments
         total_bonus = word_bonus + structure_bonus + content_bonus + timing_bonus;
         if total_bonus > 0.1:  # Significant bonus
-            self.logger.debug( f"Similarity boost: {base_similarity:.3f} -> {weighted_similarity:.3f} " \
-                             f"(word:{word_bonus:.3f}, struct:{structure_bonus:.3f}, content:{content_bonus:.3f}, timing:{timing_bonus:.3f})" );
+            # Lazy %-formatting - this runs per candidate, so skip the float formatting unless debugging
+            self.logger.debug( "Similarity boost: %.3f -> %.3f (word:%.3f, struct:%.3f, content:%.3f, timing:%.3f)",
+                               base_similarity, weighted_similarity, word_bonus, structure_bonus, content_bonus, timing_bonus );
         
         return distance, weighted_similarity;
     
-    def find_best_match( self, audio_sample: AudioSample, subtitle_processor: SubtitleProcessor ) -> Optional[AlignmentMatch]:
+    def batch_distances( self, audio_samples: List[AudioSample], subtitle_processor: SubtitleProcessor ) -> List[Optional[Dict[int, int]]]:
+        """
+        Compute Levenshtein distances for every sample against its search window.
+        
+        Uses rapidfuzz's cdist per sample: the transcription is preprocessed once
+        and scored against all window minutes, with samples spread over a thread
+        pool. Only in-window pairs are computed - a full sample x minute matrix
+        would mostly be discarded by the window.
+        
+        Args:
+            audio_samples: List of AudioSample objects with transcriptions
+            subtitle_processor: SubtitleProcessor with loaded subtitles
+            
+        Returns:
+            Per sample, a dict of candidate minute -> distance (None when the
+            sample has no searchable transcription)
+        """
+        rows = [ None ] * len( audio_samples );
+        
+        # Same filters as find_best_match: searchable transcriptions, minutes with enough text
+        sample_positions = [ i for i, sample in enumerate( audio_samples )
+                             if sample.transcription and len( sample.transcription ) >= subtitle_processor.min_chars ];
+        minutes = [ minute for minute in sorted( subtitle_processor.minute_index )
+                    if len( subtitle_processor.get_minute_text( minute ) ) >= self.min_chars ];
+        
+        if not sample_positions or not minutes:
+            return rows;
+        
+        choices = [ subtitle_processor.get_minute_features( minute )[0] for minute in minutes ];
+        
+        windows = [];  # ( sample position, lo, hi ) slices of minutes/choices to score
+        for i in sample_positions:
+            sample = audio_samples[i];
+            start_minute, end_minute = subtitle_processor.get_search_window( int( sample.start_timestamp // 60 ), self.search_window );
+            lo = bisect.bisect_left( minutes, start_minute );
+            hi = bisect.bisect_right( minutes, end_minute );
+            if lo == hi:
+                rows[i] = {};
+            else:
+                windows.append( ( i, lo, hi ) );
+        
+        def score_window( window: Tuple[int, int, int] ) -> np.ndarray:
+            i, lo, hi = window;
+            return rf_process.cdist( [ audio_samples[i].transcription_lower ], choices[lo:hi],
+                                     scorer=RFLevenshtein.distance, dtype=np.int32, workers=1 )[0];
+        
+        # cdist only spreads rows across its workers, and each sample is a single row -
+        # so fan the samples out over threads instead (rapidfuzz releases the GIL)
+        workers = min( len( windows ), os.cpu_count() or 1 );
+        if workers > 1:
+            with ThreadPoolExecutor( max_workers=workers ) as executor:
+                scored = list( executor.map( score_window, windows ) );
+        else:
+            scored = [ score_window( window ) for window in windows ];
+        
+        for ( i, lo, hi ), row in zip( windows, scored ):
+            rows[i] = dict( zip( minutes[lo:hi], row.tolist() ) );
+        
+        return rows;
+    
+    def find_best_match( self, audio_sample: AudioSample, subtitle_processor: SubtitleProcessor,
+                         distances: Optional[Dict[int, int]] = None ) -> Optional[AlignmentMatch]:
         """
         Find the best subtitle match for an audio sample.
         
@@ -168,6 +326,7 @@ class AlignmentEngine:
         Args:
             audio_sample: AudioSample with transcription
             subtitle_processor: SubtitleProcessor with loaded subtitles
+            distances: Precomputed minute -> distance for this sample (see batch_distances)
             
         Returns:
             Best AlignmentMatch or None if no good match found
@@ -190,37 +349,73 @@ class AlignmentEngine:
             self.logger.debug( f"No subtitle candidates found for sample {audio_sample.index}" );
             return None;
         
-        best_match = None;
+        best = None;  # ( similarity, minute, subtitle_text, distance ) of the best candidate so far
         best_similarity = 0.0;
         
         self.logger.debug( f"Evaluating {len( candidates )} candidates for sample {audio_sample.index}" );
         
+        # Audio-side text work is the same for every candidate - do it once
+        audio_lower = audio_sample.transcription_lower;
+        audio_features = _audio_features( audio_lower );
+        audio_length = len( audio_lower );
+        
+        # Try the minutes closest to the sample first - they are the likeliest winners,
+        # which tightens the pruning bounds below and makes the early exit hit sooner
+        candidates = sorted( candidates, key=lambda c: abs( c[0] * 60 - audio_sample.start_timestamp ) );
+        
         for minute, subtitle_text in candidates:
             # Skip if subtitle text is too short
             if len( subtitle_text ) < self.min_chars:
                 continue;
             
+            # Subtitle-side features are the same for every sample - cached per minute
+            subtitle_lower, subtitle_features = subtitle_processor.get_minute_features( minute );
+            
+            # Distance is at least the length difference, so base similarity is at most
+            # shorter/longer - skip candidates that can't beat the best even with full bonuses
+            shorter, longer = sorted( ( audio_length, len( subtitle_lower ) ) );
+            if shorter / longer + _MAX_BONUS <= best_similarity:
+                continue;
+            
+            distance = distances.get( minute ) if distances is not None else None;
+            if distance is None and best is not None:
+                # Let rapidfuzz stop early once the distance is too large to beat the best
+                max_distance = int( longer * ( 1.0 - best_similarity + _MAX_BONUS ) );
+                distance = RFLevenshtein.distance( audio_lower, subtitle_lower, score_cutoff=max_distance );
+                if distance > max_distance:
+                    continue;
+            
             # Calculate weighted similarity for better accuracy
             distance, similarity = self.calculate_weighted_similarity(
-                audio_sample.transcription.lower(),
-                subtitle_text.lower(),
+                audio_lower,
+                subtitle_lower,
                 audio_sample.start_timestamp,
-                minute
+                minute,
+                audio_features,
+                subtitle_features,
+                distance
             );
             
+            # Update best candidate if this is better
+            if similarity > best_similarity:
+                best = ( similarity, minute, subtitle_text, distance );
+                best_similarity = similarity;
+                # Weighted similarity is capped at 1.0 - nothing later can beat it
+                if best_similarity >= 1.0:
+                    break;
+        
+        # Only the winning candidate becomes an AlignmentMatch
+        best_match = None;
+        if best is not None:
+            similarity, minute, subtitle_text, distance = best;
+            
             # Check if this is a passing match
             is_match = similarity >= self.similarity_threshold and len( subtitle_text ) >= self.min_chars;
             
-            # Get subtitle timestamp (first subtitle in this minute)
-            subtitle_timestamp = None;
-            if minute in subtitle_processor.minute_index:
-                first_subtitle = min( subtitle_processor.minute_index[minute], key=lambda x: x.start_time );
-                subtitle_timestamp = first_subtitle.start_time;
-            else:
-                subtitle_timestamp = minute * 60.0;  # Fallback to minute boundary
+            # Get subtitle timestamp (first subtitle in this minute, else the minute boundary)
+            subtitle_timestamp = subtitle_processor.minute_first_ts.get( minute, minute * 60.0 );
             
-            # Create match object
-            match = AlignmentMatch(
+            best_match = AlignmentMatch(
                 audio_sample_index=audio_sample.index,
                 audio_sample_timestamp=audio_sample.start_timestamp,
                 audio_text=audio_sample.transcription,
@@ -231,11 +426,6 @@ class AlignmentEngine:
                 similarity_score=similarity,
                 is_match=is_match
             );
-            
-            # Update best match if this is better
-            if similarity > best_similarity:
-                best_match = match;
-                best_similarity = similarity;
         
         if best_match:
             status = "PASS" if best_match.is_match else "FAIL";
@@ -262,8 +452,11 @@ class AlignmentEngine:
         matches = [];
         successful_matches = 0;
         
-        for sample in audio_samples:
-            match = self.find_best_match( sample, subtitle_processor );
+        # All Levenshtein distances up front in one multithreaded batch
+        distance_rows = self.batch_distances( audio_samples, subtitle_processor );
+        
+        for sample, distances in zip( audio_samples, distance_rows ):
+            match = self.find_best_match( sample, subtitle_processor, distances );
             if match:
                 matches.append( match );
                 if match.is_match:
@@ -311,18 +504,21 @@ class AlignmentEngine:
         if not matches:
             return {};
         
-        successful = self.get_successful_matches( matches );
+        count = len( matches );
+        similarities = np.fromiter( ( m.similarity_score for m in matches ), dtype=np.float64, count=count );
+        distances = np.fromiter( ( m.levenshtein_distance for m in matches ), dtype=np.float64, count=count );
+        successful = int( np.count_nonzero( np.fromiter( ( m.is_match for m in matches ), dtype=np.bool_, count=count ) ) );
         
-        similarities = [ match.similarity_score for match in matches ];
-        avg_similarity = sum( similarities ) / len( similarities );
+        avg_similarity = float( similarities.mean() );
         
-        distances = [ match.levenshtein_distance for match in matches if match.levenshtein_distance != float( 'inf' ) ];
-        avg_distance = sum( distances ) / len( distances ) if distances else 0;
+        # Unmatched samples carry an infinite distance - leave them out of the average
+        distances = distances[np.isfinite( distances )];
+        avg_distance = float( distances.mean() ) if distances.size else 0;
         
         stats = {
             'total_matches': len( matches ),
-            'successful_matches': len( successful ),
-            'success_rate': len( successful ) / len( matches ),
+            'successful_matches': successful,
+            'success_rate': successful / count,
             'avg_similarity': avg_similarity,
             'avg_levenshtein_distance': avg_distance,
             'similarity_threshold': self.similarity_threshold,
@@ -1,28 +1,125 @@
 """
 Audio processing module for extracting and sampling audio from video files.
 """
+import io
+import json
+import math
+import os
 import random
+import re
 import tempfile
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
-import ffmpeg
+from typing import Callable, List, Dict, Optional, Tuple
+import numpy as np
 import subprocess
 
 from .logging import get_logger
-import statistics
+
+
+_PROBE_TIMEOUT = 10;  # Seconds; a format-only probe normally takes well under one
+
+_STREAM_CHUNK_SIZE = 4;  # Samples per FFmpeg run when extracted samples are streamed to a callback
+
+# TV episode markers in a filename: S01E02 / 1x02 tags, or season/episode followed by a number.
+# Tokens must stand alone (separated by ., _, -, space...) so words like "Seasoned" don't match.
+_TV_RE = re.compile(
+    r'(?<![a-z0-9])(s\d{1,2}(e\d{1,3})+|\d{1,2}x\d{2}|(season|episode)[\s._-]?\d+)(?![a-z0-9])',
+    re.IGNORECASE
+);
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on - honours affinity masks (taskset, cgroups) where the OS exposes them."""
+    try:
+        return len( os.sched_getaffinity( 0 ) );
+    except AttributeError:  # Not available on Windows/macOS
+        return os.cpu_count() or 1;
+
+
+@lru_cache( maxsize=256 )
+def _probe_duration( path: str, mtime_ns: int, size: int ) -> float:
+    """
+    Container duration from ffprobe, memoized on the file's identity.
+    
+    mtime_ns and size only key the cache, so a replaced or re-muxed file at the
+    same path is probed again. Raises if ffprobe fails, hangs or reports no
+    duration.
+    """
+    # Only format=duration is needed - skip stream probing and JSON output entirely
+    result = subprocess.run(
+        [
+            'ffprobe', '-v', 'error',
+            '-show_entries', 'format=duration',
+            '-of', 'default=noprint_wrappers=1:nokey=1',
+            path
+        ],
+        capture_output=True, text=True, check=True,
+        timeout=_PROBE_TIMEOUT  # A stalled network mount must not hang the run
+    );
+    return float( result.stdout.strip() );
 
 
 class AudioSample:
     """Represents a single audio sample extracted from a video."""
     
-    def __init__( self, index: int, start_timestamp: float, file_path: Path ):
+    def __init__( self, index: int, start_timestamp: float, file_path: Optional[Path] = None,
+                  pcm: Optional[np.ndarray] = None, sample_rate: int = 16000 ):
         self.index = index;           # Sample index (0-based)
         self.start_timestamp = start_timestamp;  # Start time in seconds  
-        self.file_path = file_path;   # Path to extracted audio file
-        self.transcription = None;    # Will be filled by transcription engine
+        self.file_path = file_path;   # Path to an audio file on disk, if the sample lives in one
+        self.pcm = pcm;               # In-memory mono int16 PCM (extracted samples; may view a shared batch buffer), else None
+        self.sample_rate = sample_rate;  # Sample rate of pcm in Hz
+        self.transcription = None;    # Will be filled by transcription engine (also sets transcription_lower)
+    
+    @property
+    def transcription( self ) -> Optional[str]:
+        """AI transcribed text, or None until transcribed."""
+        return self._transcription;
+    
+    @transcription.setter
+    def transcription( self, text: Optional[str] ):
+        self._transcription = text;
+        self.transcription_lower = text.lower() if text else text;  # Lowercased once at ingest for alignment
+    
+    def wav_bytes( self ) -> bytes:
+        """Audio as a complete WAV file in memory, for transcription APIs that take a file."""
+        if self.pcm is None:
+            return self.file_path.read_bytes();
+        
+        buffer = io.BytesIO();
+        with wave.open( buffer, 'wb' ) as wav:
+            wav.setnchannels( 1 );
+            wav.setsampwidth( 2 );
+            wav.setframerate( self.sample_rate );
+            wav.writeframes( self.pcm.astype( '<i2', copy=False ).tobytes() );
+        return buffer.getvalue();
+    
+    def opus_bytes( self, bitrate: str = '16k' ) -> Optional[bytes]:
+        """
+        Audio as an Ogg/Opus file in memory, for bandwidth-bound uploads.
+        
+        Speech at 16 kbit/s Opus is ~16x smaller than 16-bit PCM WAV with no
+        practical loss for transcription. Returns None if FFmpeg (or its libopus
+        encoder) is unavailable, so callers can fall back to wav_bytes().
+        """
+        try:
+            result = subprocess.run(
+                # Lowest encoder complexity: ~4x faster than the default for ~5% more bytes
+                [ 'ffmpeg', '-hide_banner', '-loglevel', 'error', '-i', 'pipe:0',
+                  '-c:a', 'libopus', '-b:a', bitrate, '-application', 'voip', '-compression_level', '0',
+                  '-f', 'ogg', 'pipe:1' ],
+                input=self.wav_bytes(), capture_output=True, check=True
+            );
+        except ( subprocess.CalledProcessError, OSError ):
+            return None;
+        return result.stdout or None;
     
     def __repr__( self ):
-        return f"AudioSample(index={self.index}, start={self.start_timestamp}s, path={self.file_path})";
+        source = f"path={self.file_path}" if self.pcm is None else f"pcm={len( self.pcm ) / self.sample_rate:.1f}s";
+        return f"AudioSample(index={self.index}, start={self.start_timestamp}s, {source})";
 
 
 class AudioProcessor:
@@ -36,7 +133,7 @@ class AudioProcessor:
     - Format conversion for AI compatibility (16kHz mono PCM)
     """
     
-    def __init__( self, temp_dir: Optional[Path] = None, debug: bool = False ):
+    def __init__( self, temp_dir: Optional[Path] = None, debug: bool = False, max_workers: Optional[int] = None ):
         self.logger = get_logger( debug=debug );
         self.temp_dir = Path( temp_dir ) if temp_dir else Path( "tmp" );
         self.temp_dir.mkdir( exist_ok=True );
@@ -46,39 +143,92 @@ class AudioProcessor:
         self.channels = 1;         # Mono
         self.sample_durations = [ 30, 60, 90 ];  # Multi-duration sampling for better coverage
         self.primary_duration = 60; # Primary duration for most samples
+        self.max_workers = max_workers or _available_cpus();  # Concurrent FFmpeg processes
+        
+        # Probed durations persisted across runs: "path|mtime_ns|size" -> seconds
+        self.probe_cache_file = self.temp_dir / ".probe_cache.json";
+        self._probe_cache = None;  # Loaded on first use
+        
+        self._filter_chain = self._preprocessing_filters();  # Same for every sample - built once
+        
+        # Fixed parts of every extraction argv - only the inputs and filter graph vary.
+        # Parallelism comes from running one FFmpeg per worker, so each keeps its filter
+        # graph (afftdn slice-threads) on one thread instead of oversubscribing the cores
+        self._argv_head = [ 'ffmpeg', '-hide_banner', '-nostdin', '-loglevel', 'error', '-filter_complex_threads', '1' ];
+        self._argv_tail = [ '-map', '[out]', '-acodec', 'pcm_s16le', '-f', 's16le', 'pipe:1' ];
     
     def get_video_duration( self, video_file: Path ) -> Optional[float]:
         """
         Get video duration in seconds using FFprobe.
         
+        Durations are cached by path, mtime and size - in memory and in
+        temp_dir/.probe_cache.json - so repeat runs skip the ffprobe start-up.
+        
         Returns:
             Duration in seconds, or None if detection fails
         """
         try:
-            probe = ffmpeg.probe( str( video_file ) );
-            duration = float( probe['format']['duration'] );
+            st = Path( video_file ).stat();
+            path = str( Path( video_file ).resolve() );
+            key = f"{path}|{st.st_mtime_ns}|{st.st_size}";
+            
+            cache = self._load_probe_cache();
+            duration = cache.get( key );
+            if duration is None:
+                duration = _probe_duration( path, st.st_mtime_ns, st.st_size );
+                # Drop entries for older versions of this file so the cache doesn't grow per edit
+                for stale in [ k for k in cache if k.startswith( path + '|' ) ]:
+                    del cache[stale];
+                cache[key] = duration;
+                self._save_probe_cache();
+            
             self.logger.debug( f"Video duration: {duration:.2f} seconds ({duration/60:.1f} minutes)" );
             return duration;
         except Exception as e:
             self.logger.warning( f"Could not determine video duration: {e}" );
             return None;
     
+    def _load_probe_cache( self ) -> Dict[str, float]:
+        """Load the persisted probe cache, starting empty if it is missing or unreadable."""
+        if self._probe_cache is None:
+            try:
+                self._probe_cache = json.loads( self.probe_cache_file.read_text() );
+            except ( OSError, ValueError ):
+                self._probe_cache = {};
+        return self._probe_cache;
+    
+    def _save_probe_cache( self ):
+        """
+        Persist the probe cache; failures only cost a re-probe next run.
+        
+        Written to a temp file and renamed over the cache, so a concurrent run
+        or an interrupted write never leaves a truncated file behind.
+        """
+        try:
+            fd, tmp_name = tempfile.mkstemp( dir=self.temp_dir, prefix=".probe_cache.", suffix=".tmp" );
+            try:
+                with os.fdopen( fd, 'w' ) as f:
+                    json.dump( self._probe_cache, f );
+                os.replace( tmp_name, self.probe_cache_file );
+            except BaseException:
+                Path( tmp_name ).unlink( missing_ok=True );
+                raise;
+        except OSError as e:
+            self.logger.debug( f"Could not save probe cache: {e}" );
+    
     def estimate_duration_from_filename( self, video_file: Path ) -> float:
         """
         Estimate duration based on filename patterns.
         
         Uses heuristics:
-        - TV shows (contains S##E##, season/episode): 20 minutes
+        - TV shows (contains S##E##, #x##, season/episode N): 20 minutes
         - Movies (default): 90 minutes
         
         Returns:
             Estimated duration in seconds
         """
-        filename = video_file.name.lower();
-        
-        # TV show patterns
-        tv_patterns = [ 's', 'season', 'episode', 'e' ];
-        is_tv = any( pattern in filename for pattern in tv_patterns );
+        # TV show patterns (single regex scan; bare letters like 's'/'e' matched nearly every name)
+        is_tv = bool( _TV_RE.search( video_file.name ) );
         
         if is_tv:
             duration = 20 * 60;  # 20 minutes
@@ -91,6 +241,16 @@ class AudioProcessor:
     
     def generate_sample_times( self, duration: float, num_samples: int = None, use_sliding_window: bool = True, phase: str = "initial" ) -> List[float]:
         """
+        Generate sample start times based on video duration (see generate_sample_candidates).
+        
+        Returns:
+            List of start times in seconds
+        """
+        return self.generate_sample_candidates( duration, num_samples, use_sliding_window, phase )[0];
+    
+    def generate_sample_candidates( self, duration: float, num_samples: int = None, use_sliding_window: bool = True,
+                                    phase: str = "initial" ) -> Tuple[List[float], List[float]]:
+        """
         Generate sample start times based on video duration using improved sampling strategy.
         
         Enhanced Strategy:
@@ -106,7 +266,9 @@ class AudioProcessor:
             use_sliding_window: Use overlapping samples for better coverage
             
         Returns:
-            List of start times in seconds
+            Tuple of (chosen, reserve) start times in seconds - reserve holds the
+            candidate positions that were not chosen, shuffled, for retrying failed samples,
+            followed by off-grid positions midway between grid positions (shuffled too)
         """
         if use_sliding_window:
             # Enhanced sliding window strategy
@@ -121,17 +283,14 @@ class AudioProcessor:
         
         effective_duration = duration - end_buffer;
         
-        # Generate all possible sample positions
-        all_positions = [];
-        current_pos = start_offset;
+        # Generate all possible sample positions: every start_offset + k * sample_interval
+        # whose sample still ends before effective_duration
+        position_count = max( 0, math.ceil( ( effective_duration - self.primary_duration - start_offset ) / sample_interval ) );
+        all_positions = start_offset + sample_interval * np.arange( position_count, dtype=np.float64 );
         
-        while current_pos + self.primary_duration < effective_duration:
-            all_positions.append( current_pos );
-            current_pos += sample_interval;
-        
-        if not all_positions:
+        if not position_count:
             self.logger.warning( "No valid sample positions found" );
-            return [];
+            return [], [];
         
         # Adaptive sample selection based on phase
         if phase == "initial":
@@ -143,32 +302,40 @@ class AudioProcessor:
         else:
             max_samples = num_samples if num_samples else 20;  # Default fallback
         
-        if len( all_positions ) <= max_samples:
-            sample_times = all_positions;
+        # Off-grid retry fallback midway between grid positions - the only reserve when every
+        # grid position is chosen (any video short enough to need position_count <= max_samples)
+        off_grid = all_positions + sample_interval / 2;
+        off_grid = off_grid[off_grid < effective_duration - self.primary_duration].tolist();
+        random.shuffle( off_grid );
+        
+        if position_count <= max_samples:
+            sample_times = all_positions.tolist();
+            reserve = off_grid;
             self.logger.info( f"Using all {len( sample_times )} available samples" );
         else:
             # For longer videos, use strategic selection:
             # - Ensure good coverage across the entire duration
             # - Prefer samples from dialogue-heavy middle sections
-            step = len( all_positions ) / max_samples;
-            sample_times = [];
+            # Evenly strided picks floor( i * count / max ) - exact integer arithmetic,
+            # always in range and already in ascending order
+            chosen = np.arange( max_samples ) * position_count // max_samples;
+            sample_times = all_positions[chosen].tolist();
             
-            for i in range( max_samples ):
-                index = int( i * step );
-                if index < len( all_positions ):
-                    sample_times.append( all_positions[index] );
+            unchosen = np.ones( position_count, dtype=bool );
+            unchosen[chosen] = False;
+            reserve = all_positions[unchosen].tolist();
+            random.shuffle( reserve );  # Retries take reserves from the front
+            reserve += off_grid;
             
-            self.logger.info( f"Video has {len( all_positions )} possible samples, selected {len( sample_times )} strategically" );
-        
-        sample_times.sort();  # Sort for consistent processing
+            self.logger.info( f"Video has {position_count} possible samples, selected {len( sample_times )} strategically" );
         
         interval_desc = "sliding window (2.5m)" if use_sliding_window else "fixed interval (5m)";
         self.logger.info( f"Sample times ({interval_desc}): {[ round( t/60, 1 ) for t in sample_times ]}" );
-        return sample_times;
+        return sample_times, reserve;
     
-    def _apply_audio_preprocessing( self, stream, output_file: Path ):
+    def _preprocessing_filters( self ) -> str:
         """
-        Apply enhanced audio preprocessing for better AI transcription quality.
+        Build the enhanced audio preprocessing chain for better AI transcription quality.
         
         Preprocessing steps:
         1. Noise reduction for cleaner speech
@@ -177,21 +344,27 @@ class AudioProcessor:
         4. Compander to enhance dialogue clarity
         5. Format conversion to AI-optimal specs
         
-        Args:
-            stream: FFmpeg input stream
-            output_file: Output file path
-            
+        Audio is resampled to the 16kHz output rate before the first filter, so
+        the whole chain runs at a third of the usual 48kHz source rate.
+        The chain runs inside a -filter_complex graph, so FFmpeg negotiates the
+        final mono format back through it and the downmix happens before the
+        filters run instead of after.
+        
         Returns:
-            Configured FFmpeg output stream
+            Comma-joined filter chain producing 16kHz mono signed 16-bit PCM
         """
-        # Build audio filter chain for enhanced transcription
         filters = [];
         
+        # Speech needs nothing above 8kHz - drop to the output rate before doing any work
+        filters.append( f'aformat=sample_rates={self.sample_rate}:channel_layouts=mono' );
+        
         # 1. High-pass filter to remove low-frequency rumble/noise (below 80Hz)
         filters.append( 'highpass=f=80' );
         
-        # 2. Audio normalization to -16dB (good level for speech recognition)
-        filters.append( 'loudnorm=I=-16:LRA=11:TP=-2' );
+        # 2. Audio normalization to consistent speech levels
+        # Single-pass dynaudnorm: loudnorm's one-pass mode upsamples to 192kHz internally and
+        # cost more than the rest of the extraction put together
+        filters.append( 'dynaudnorm=f=150:g=15' );
         
         # 3. Noise reduction using FFmpeg's afftdn filter
         # This helps with robot sounds, mechanical noise, etc.
@@ -204,23 +377,41 @@ class AudioProcessor:
         # 5. Final level adjustment and limiting
         filters.append( 'alimiter=level_in=1:level_out=0.8:limit=0.9' );
         
-        # Combine all filters
-        filter_string = ','.join( filters );
+        # Format conversion: 16-bit PCM, 16kHz, mono
+        filters.append( f'aformat=sample_fmts=s16:sample_rates={self.sample_rate}:channel_layouts=mono' );
         
-        self.logger.debug( f"Audio preprocessing chain: {filter_string}" );
+        return ','.join( filters );
+    
+    def _pcm_command( self, video_file: Path, sample_specs: List[Tuple[float, int, int]], pad: bool ) -> List[str]:
+        """
+        Build the ffmpeg argv that writes the given samples to stdout as one raw PCM stream.
         
-        # Apply filters and output configuration
-        stream = ffmpeg.output(
-            stream,
-            str( output_file ),
-            acodec='pcm_s16le',          # 16-bit PCM for compatibility
-            ar=self.sample_rate,         # 16kHz sample rate
-            ac=self.channels,            # Mono channel
-            af=filter_string,            # Apply preprocessing filters
-            f='wav'                      # WAV format
-        );
+        Each sample is its own input, seeked with -ss/-t before -i (a fast demuxer
+        seek, not a decode from 0), run through the preprocessing chain and
+        concatenated in spec order. With pad, every sample is padded/trimmed to
+        exactly duration seconds so the stream can be sliced back apart.
+        """
+        cmd = list( self._argv_head );
+        graph = [];
         
-        return stream;
+        for k, ( start_time, _, duration ) in enumerate( sample_specs ):
+            cmd += [ '-ss', str( start_time ), '-t', str( duration ), '-i', str( video_file ) ];
+            
+            chain = self._filter_chain;
+            if pad:
+                frames = duration * self.sample_rate;
+                chain += f',apad=whole_len={frames},atrim=end_sample={frames}';
+            # Multiple inputs disable FFmpeg's automatic stream selection - use the first audio track
+            graph.append( f'[{k}:a:0]{chain}[s{k}]' );
+        
+        graph.append( ''.join( f'[s{k}]' for k in range( len( sample_specs ) ) ) + f'concat=n={len( sample_specs )}:v=0:a=1[out]' );
+        
+        return cmd + [ '-filter_complex', ';'.join( graph ) ] + self._argv_tail;
+    
+    def _run_pcm( self, cmd: List[str] ) -> np.ndarray:
+        """Run an ffmpeg command writing raw PCM to stdout and return it as int16 samples."""
+        result = subprocess.run( cmd, capture_output=True, check=True );
+        return np.frombuffer( result.stdout, dtype='<i2' );
     
     def extract_audio_sample( self, video_file: Path, start_time: float, index: int, duration: int = None ) -> Optional[AudioSample]:
         """
@@ -238,36 +429,137 @@ class AudioProcessor:
         if duration is None:
             duration = self.primary_duration;
         
-        output_file = self.temp_dir / f"sample_{index:03d}_{int( start_time )}_{duration}s.wav";
-        
         try:
-            self.logger.debug( f"Extracting sample {index} from {start_time}s ({duration}s duration) to {output_file}" );
+            self.logger.debug( "Extracting sample %d from %ss (%ss duration)", index, start_time, duration );
             
-            # FFmpeg command: extract audio segment with specific format
-            stream = ffmpeg.input( str( video_file ), ss=start_time, t=duration );
             # Enhanced audio preprocessing for better transcription quality
-            stream = self._apply_audio_preprocessing( stream, output_file );
-            
-            ffmpeg.run( stream, overwrite_output=True, quiet=True );
+            pcm = self._run_pcm( self._pcm_command( video_file, [ ( start_time, index, duration ) ], pad=False ) );
             
-            # Verify extraction succeeded
-            if output_file.exists() and output_file.stat().st_size > 0:
-                sample = AudioSample( index, start_time, output_file );
-                sample.duration = duration;  # Store duration for reference
-                self.logger.debug( f"Successfully extracted {duration}s sample: {sample}" );
-                return sample;
-            else:
-                self.logger.error( f"Audio extraction failed for sample {index}" );
-                return None;
+            return self._make_sample( index, start_time, duration, pcm );
                 
-        except ffmpeg.Error as e:
-            self.logger.error( f"FFmpeg error extracting sample {index}: {e}" );
+        except subprocess.CalledProcessError as e:
+            self.logger.error( f"FFmpeg error extracting sample {index}: {e.stderr.decode( errors='replace' ).strip()}" );
             return None;
         except Exception as e:
             self.logger.error( f"Unexpected error extracting sample {index}: {e}" );
             return None;
     
-    def extract_multi_duration_samples( self, video_file: Path, sample_times: List[float], max_samples: int = 20 ) -> List[AudioSample]:
+    def _make_sample( self, index: int, start_time: float, duration: int, pcm: np.ndarray ) -> Optional[AudioSample]:
+        """Wrap extracted PCM in an AudioSample, or log and return None if nothing was decoded."""
+        # Verify extraction succeeded
+        if not pcm.size:
+            self.logger.error( f"Audio extraction failed for sample {index}" );
+            return None;
+        
+        sample = AudioSample( index, start_time, pcm=pcm, sample_rate=self.sample_rate );
+        sample.duration = duration;  # Store duration for reference
+        self.logger.debug( "Successfully extracted %ss sample: %s", duration, sample );  # Lazy - skips the repr unless debugging
+        return sample;
+    
+    def extract_audio_samples_batch( self, video_file: Path, sample_specs: List[Tuple[float, int, int]],
+                                     on_extracted: Optional[Callable[[AudioSample], None]] = None ) -> List[AudioSample]:
+        """
+        Extract many audio samples with as few FFmpeg invocations as possible.
+        
+        Samples are split into one contiguous chunk per worker (max_workers, one
+        per CPU core by default) and each chunk is extracted by a single FFmpeg
+        process (see _extract_batch). The processes run side by side from a
+        thread pool - the work happens in the child processes, so threads are
+        enough to keep every core busy. With on_extracted, chunks are capped at
+        _STREAM_CHUNK_SIZE samples so the first samples reach the callback
+        after a few seconds instead of when the whole batch is done.
+        
+        Args:
+            video_file: Path to input video
+            sample_specs: List of (start_time, index, duration) tuples
+            on_extracted: Optional callback, called with each sample as soon as
+                its chunk is extracted (from the worker thread)
+            
+        Returns:
+            List of successfully extracted AudioSample objects, in spec order
+        """
+        if not sample_specs:
+            return [];
+        
+        # Decoded sample lengths are cut to the media's end - probe it once, before the worker threads
+        media_duration = self.get_video_duration( video_file );
+        
+        def extract_chunk( chunk ):
+            samples = self._extract_batch( video_file, chunk, media_duration );
+            if on_extracted:
+                for sample in samples:
+                    on_extracted( sample );
+            return samples;
+        
+        workers = min( len( sample_specs ), self.max_workers );
+        chunk_size = -( -len( sample_specs ) // workers );  # Ceiling division
+        if on_extracted:
+            chunk_size = min( chunk_size, _STREAM_CHUNK_SIZE );  # A few more FFmpeg starts, much earlier first samples
+        if chunk_size >= len( sample_specs ):
+            return extract_chunk( sample_specs );
+        
+        chunks = [ sample_specs[i:i + chunk_size] for i in range( 0, len( sample_specs ), chunk_size ) ];
+        
+        with ThreadPoolExecutor( max_workers=workers ) as executor:
+            results = executor.map( extract_chunk, chunks );
+            return [ sample for samples in results for sample in samples ];
+    
+    def _extract_batch( self, video_file: Path, sample_specs: List[Tuple[float, int, int]],
+                        media_duration: Optional[float] ) -> List[AudioSample]:
+        """
+        Extract audio samples with a single FFmpeg invocation, straight into memory.
+        
+        Each sample becomes its own input-seeked (-ss/-t before -i) copy of the
+        video with its own preprocessing chain. The chains are padded/trimmed to
+        exactly duration seconds and concatenated into one raw PCM stream on
+        stdout, which is sliced back into samples - no temp files, and one
+        process start serves every sample. Each sample keeps its real decoded
+        length: the requested duration, cut short where the media ends. If the
+        batched run fails, or the media duration is unknown so the padding
+        can't be told apart from audio, falls back to extracting the samples
+        one at a time so a single bad segment does not lose the rest.
+        
+        Args:
+            video_file: Path to input video
+            sample_specs: List of (start_time, index, duration) tuples
+            media_duration: Probed media duration in seconds, or None if unknown
+            
+        Returns:
+            List of successfully extracted AudioSample objects, in spec order
+        """
+        try:
+            if media_duration is None:
+                raise ValueError( "media duration unknown, cannot strip segment padding" );
+            self.logger.debug( f"Extracting {len( sample_specs )} samples in one FFmpeg run" );
+            pcm = self._run_pcm( self._pcm_command( video_file, sample_specs, pad=True ) );
+            if pcm.size != sum( duration for _, _, duration in sample_specs ) * self.sample_rate:
+                raise ValueError( f"expected {len( sample_specs )} padded segments, got {pcm.size} samples" );
+        except ( subprocess.CalledProcessError, OSError, ValueError ) as e:
+            self.logger.warning( f"Batched extraction failed, extracting samples individually: {e}" );
+            samples = [ self.extract_audio_sample( video_file, start_time, index, duration )
+                        for start_time, index, duration in sample_specs ];
+            return [ sample for sample in samples if sample ];
+        
+        # Samples are zero-copy views into the batch's one contiguous int16 buffer -
+        # the array-of-PCM layout without a second copy into a per-sample matrix
+        samples = [];
+        offset = 0;
+        for start_time, index, duration in sample_specs:
+            segment = pcm[offset:offset + duration * self.sample_rate];
+            offset += len( segment );
+            
+            # Drop the padding again by length, not by value (real trailing silence is audio) -
+            # a segment cut short by the end of the media keeps only its decoded part, and one
+            # entirely past the end comes back empty
+            decoded = max( 0.0, min( float( duration ), media_duration - start_time ) );
+            sample = self._make_sample( index, start_time, duration, segment[:round( decoded * self.sample_rate )] );
+            if sample:
+                samples.append( sample );
+        
+        return samples;
+    
+    def extract_multi_duration_samples( self, video_file: Path, sample_times: List[float], max_samples: int = 20,
+                                        on_extracted: Optional[Callable[[AudioSample], None]] = None ) -> List[AudioSample]:
         """
         Extract samples with multiple durations for comprehensive coverage.
         
@@ -280,11 +572,11 @@ class AudioProcessor:
             video_file: Path to input video file
             sample_times: List of sample start times
             max_samples: Maximum number of samples to extract
+            on_extracted: Optional per-sample callback (see extract_audio_samples_batch)
             
         Returns:
             List of successfully extracted AudioSample objects
         """
-        samples = [];
         total_samples = min( len( sample_times ), max_samples );
         
         # Calculate distribution
@@ -294,22 +586,14 @@ class AudioProcessor:
         
         self.logger.info( f"Multi-duration extraction plan: {standard_count}×60s, {short_count}×30s, {long_count}×90s" );
         
-        for i, start_time in enumerate( sample_times[:total_samples] ):
-            # Determine duration based on distribution
-            if i < standard_count:
-                duration = 60;  # Standard
-            elif i < standard_count + short_count:
-                duration = 30;  # Short
-            else:
-                duration = 90;  # Long
-            
-            sample = self.extract_audio_sample( video_file, start_time, i, duration );
-            if sample:
-                samples.append( sample );
+        # Durations in plan order: standard, then short, then long
+        durations = [ 60 ] * standard_count + [ 30 ] * short_count + [ 90 ] * long_count;
+        sample_specs = list( zip( sample_times[:total_samples], range( total_samples ), durations ) );
         
-        return samples;
+        return self.extract_audio_samples_batch( video_file, sample_specs, on_extracted );
     
-    def extract_audio_samples( self, video_file: Path, num_samples: int = None ) -> List[AudioSample]:
+    def extract_audio_samples( self, video_file: Path, num_samples: int = None,
+                               on_extracted: Optional[Callable[[AudioSample], None]] = None ) -> List[AudioSample]:
         """
         Extract multiple audio samples from video file with retry logic.
         
@@ -318,6 +602,9 @@ class AudioProcessor:
         Args:
             video_file: Path to input video file
             num_samples: Ignored (kept for backward compatibility)
+            on_extracted: Optional callback, called with each sample (retries included)
+                as soon as it is extracted - lets callers start work on early
+                samples while later ones are still being extracted
             
         Returns:
             List of successfully extracted AudioSample objects
@@ -329,49 +616,48 @@ class AudioProcessor:
         if duration is None:
             duration = self.estimate_duration_from_filename( video_file );
         
-        # Generate sample times using sliding window strategy
-        sample_times = self.generate_sample_times( duration, num_samples );
+        # Generate sample times using sliding window strategy (reserve positions feed retries)
+        sample_times, reserve_times = self.generate_sample_candidates( duration, num_samples );
         if not sample_times:
             self.logger.error( "No sample times generated" );
             return [];
         
         # Extract samples using multi-duration strategy for better coverage
         max_samples = num_samples if num_samples else 20;
-        samples = self.extract_multi_duration_samples( video_file, sample_times, max_samples );
+        samples = self.extract_multi_duration_samples( video_file, sample_times, max_samples, on_extracted );
         
         # Identify failed extractions for potential retry
-        failed_indices = [];
-        for i, start_time in enumerate( sample_times[:max_samples] ):
-            if i >= len( samples ) or not samples[i] or samples[i].start_timestamp != start_time:
-                failed_indices.append( i );
+        attempted = sample_times[:max_samples];
+        extracted = set( sample.index for sample in samples );
+        failed_indices = [ i for i in range( len( attempted ) ) if i not in extracted ];
         
-        # Retry failed extractions once with different random times
+        # Retry failed extractions once at unused candidate positions (grid first, then off-grid)
         max_samples = num_samples if num_samples is not None else len( sample_times );
         if failed_indices and len( samples ) < max_samples:
-            self.logger.info( f"Retrying {len( failed_indices )} failed extractions" );
-            
-            # Generate new sample times for retries
-            all_positions = list( range( int( 5*60 ), int( duration-60 ), int( 5*60 ) ) );
-            used_times = set( int( sample.start_timestamp ) for sample in samples );
-            available_times = [ t for t in all_positions if t not in used_times ];
-            
-            retry_times = random.sample( available_times, min( len( failed_indices ), len( available_times ) ) );
-            
-            for retry_idx, start_time in enumerate( retry_times ):
-                sample = self.extract_audio_sample( video_file, start_time, len( samples ) + retry_idx );
-                if sample:
-                    samples.append( sample );
+            retry_times = reserve_times[:len( failed_indices )];
+            if not retry_times:
+                self.logger.warning( f"No unused sample positions to retry {len( failed_indices )} failed extractions" );
+            else:
+                self.logger.info( f"Retrying {len( retry_times )} failed extractions" );
+                
+                # Indices continue after the attempted ones so they never collide with extracted samples
+                retry_specs = [ ( start_time, len( attempted ) + retry_idx, self.primary_duration )
+                                for retry_idx, start_time in enumerate( retry_times ) ];
+                samples.extend( self.extract_audio_samples_batch( video_file, retry_specs, on_extracted ) );
         
         self.logger.info( f"Successfully extracted {len( samples )} audio samples" );
         return samples;
     
     def cleanup_samples( self, samples: List[AudioSample] ):
-        """Clean up temporary audio sample files."""
+        """Release in-memory sample audio and clean up any audio files on disk."""
         for sample in samples:
+            sample.pcm = None;
+            if sample.file_path is None:
+                continue;  # Extracted samples live only in memory
             try:
-                if sample.file_path.exists():
-                    sample.file_path.unlink();
-                    self.logger.debug( f"Cleaned up {sample.file_path}" );
+                # missing_ok replaces the exists() check - one syscall per file instead of two
+                sample.file_path.unlink( missing_ok=True );
+                self.logger.debug( "Cleaned up %s", sample.file_path );
             except Exception as e:
                 self.logger.warning( f"Could not clean up {sample.file_path}: {e}" );
 
@@ -409,13 +695,11 @@ class AdaptiveSamplingCoordinator:
         if len( offset_points ) < 3:
             return "insufficient_data";
         
-        # Calculate variance in timing offsets
-        mean_offset = statistics.mean( offset_points );
-        variance = statistics.variance( offset_points ) if len( offset_points ) > 1 else 0;
-        std_dev = statistics.stdev( offset_points ) if len( offset_points ) > 1 else 0;
-        
-        # Calculate range (max - min)
-        offset_range = max( offset_points ) - min( offset_points );
+        # Spread of the timing offsets - one array, sample standard deviation and range
+        offsets = np.asarray( offset_points, dtype=np.float64 );
+        mean_offset = float( offsets.mean() );
+        std_dev = float( offsets.std( ddof=1 ) );
+        offset_range = float( offsets.max() - offsets.min() );
         
         self.logger.debug( f"Timing analysis: mean={mean_offset:.2f}s, std_dev={std_dev:.2f}s, range={offset_range:.2f}s" );
         
@@ -2,6 +2,7 @@
 Backup utility with intelligent file retention based on user rules.
 """
 import os
+import re
 import shutil
 from datetime import datetime
 from pathlib import Path
@@ -10,6 +11,12 @@ from typing import List, Tuple
 from .logging import get_logger
 
 
+# Backup timestamps: ISO-8601 with '-' instead of ':' so they are valid in filenames
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H-%M-%S";
+_TIMESTAMP_LEN = len( "YYYY-MM-DDTHH-MM-SS" );
+_TIMESTAMP_RE = re.compile( r'\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2}' );
+
+
 class BackupManager:
     """
     Manages backup files with retention policies based on file size.
@@ -41,10 +48,10 @@ class BackupManager:
         Returns:
             Backup filename with timestamp
         """
-        timestamp = datetime.now().isoformat().replace( ":", "-" ).split( "." )[0];  # Remove microseconds
+        timestamp = datetime.now().strftime( _TIMESTAMP_FORMAT );  # Second resolution, no microseconds
         return f"{original_file.stem}.{timestamp}{original_file.suffix}";
     
-    def get_existing_backups( self, original_file: Path ) -> List[Tuple[Path, datetime, int]]:
+    def get_existing_backups( self, original_file: Path ) -> List[Tuple[Path, str, int]]:
         """
         Get list of existing backup files for the original file.
         
@@ -52,28 +59,41 @@ class BackupManager:
             original_file: Path to original file
             
         Returns:
-            List of (backup_path, timestamp, size_bytes) tuples, sorted by timestamp
+            List of (backup_path, timestamp, size_bytes) tuples, sorted by timestamp.
+            timestamp is the filename's YYYY-MM-DDTHH-MM-SS string - fixed-width, so it
+            sorts chronologically as-is (datetime.strptime( timestamp, _TIMESTAMP_FORMAT )
+            gives a datetime where one is needed)
         """
-        backup_pattern = f"{original_file.stem}.????-??-??T??-??-??{original_file.suffix}";
-        existing_backups = list( self.backup_dir.glob( backup_pattern ) );
+        # Backups are named <stem>.<timestamp><suffix> - match on fixed prefix, suffix and length
+        prefix = f"{original_file.stem}.";
+        suffix = original_file.suffix;
+        name_len = len( prefix ) + _TIMESTAMP_LEN + len( suffix );
         
+        # Single directory pass - no glob walk followed by a second stat round
         backup_info = [];
-        for backup_path in existing_backups:
-            try:
-                # Extract timestamp from filename
-                timestamp_str = backup_path.stem.split( ".", 1 )[1];  # Remove original name part
-                timestamp_str = timestamp_str.replace( "-", ":", 2 );  # Fix time part
-                timestamp = datetime.fromisoformat( timestamp_str );
+        with os.scandir( self.backup_dir ) as entries:
+            for entry in entries:
+                name = entry.name;
+                if len( name ) != name_len or not name.startswith( prefix ) or not name.endswith( suffix ):
+                    continue;
                 
-                # Get file size
-                size_bytes = backup_path.stat().st_size;
+                # Timestamp sits between the original name and the extension; a shape check is
+                # all that's needed - it is only ever sorted, never parsed
+                timestamp = name[len( prefix ):len( prefix ) + _TIMESTAMP_LEN];
+                if not _TIMESTAMP_RE.fullmatch( timestamp ):
+                    self.logger.debug( f"Skipping malformed backup file {entry.path}" );
+                    continue;
                 
-                backup_info.append( ( backup_path, timestamp, size_bytes ) );
-                
-            except ( ValueError, IndexError, OSError ) as e:
-                self.logger.debug( f"Skipping malformed backup file {backup_path}: {e}" );
+                try:
+                    # Get file size
+                    size_bytes = entry.stat().st_size;
+                    
+                    backup_info.append( ( Path( entry.path ), timestamp, size_bytes ) );
+                    
+                except OSError as e:
+                    self.logger.debug( f"Skipping unreadable backup file {entry.path}: {e}" );
         
-        # Sort by timestamp (oldest first)
+        # Sort by timestamp (oldest first) - plain string comparison on the fixed-width stamps
         backup_info.sort( key=lambda x: x[1] );
         
         return backup_info;
@@ -166,17 +186,23 @@ class BackupManager:
         if not self.backup_dir.exists():
             return { 'total_backups': 0, 'total_size': 0 };
         
-        backup_files = list( self.backup_dir.iterdir() );
-        total_backups = len( backup_files );
-        total_size = sum( f.stat().st_size for f in backup_files if f.is_file() );
-        
-        # Categorize by size
+        # One directory pass: DirEntry.is_file() comes from the directory listing and
+        # DirEntry.stat() is cached, so each backup costs at most one stat call
+        total_backups = 0;
+        total_size = 0;
         small_files = 0;
         large_files = 0;
         
-        for f in backup_files:
-            if f.is_file():
-                size = f.stat().st_size;
+        with os.scandir( self.backup_dir ) as entries:
+            for entry in entries:
+                if not entry.is_file( follow_symlinks=False ):
+                    continue;
+                size = entry.stat( follow_symlinks=False ).st_size;
+                
+                total_backups += 1;
+                total_size += size;
+                
+                # Categorize by size
                 if size < self.size_threshold:
                     small_files += 1;
                 else:
@@ -86,25 +86,29 @@ class SubShiftLogger:
         
         return logger;
     
-    def debug( self, message, **kwargs ):
+    def debug( self, message, *args, **kwargs ):
         """Log debug message."""
-        self.logger.debug( message, **kwargs );
+        self.logger.debug( message, *args, **kwargs );
     
-    def info( self, message, **kwargs ):
+    def info( self, message, *args, **kwargs ):
         """Log info message."""
-        self.logger.info( message, **kwargs );
+        self.logger.info( message, *args, **kwargs );
     
-    def warning( self, message, **kwargs ):
+    def warning( self, message, *args, **kwargs ):
         """Log warning message."""
-        self.logger.warning( message, **kwargs );
+        self.logger.warning( message, *args, **kwargs );
     
-    def error( self, message, **kwargs ):
+    def error( self, message, *args, **kwargs ):
         """Log error message."""
-        self.logger.error( message, **kwargs );
+        self.logger.error( message, *args, **kwargs );
     
-    def critical( self, message, **kwargs ):
+    def critical( self, message, *args, **kwargs ):
         """Log critical message."""
-        self.logger.critical( message, **kwargs );
+        self.logger.critical( message, *args, **kwargs );
+    
+    def isEnabledFor( self, level: int ) -> bool:
+        """Check whether messages at level would be emitted, to skip building them otherwise."""
+        return self.logger.isEnabledFor( level );
 
 
 # Global logger instance
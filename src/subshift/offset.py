@@ -1,18 +1,29 @@
 """
 Offset calculation and subtitle correction module.
 """
+import logging
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Tuple, Union
+import numpy as np
 import pysrt
-import statistics
 
-from .align import AlignmentMatch
+from .align import AlignmentMatch, AlignmentMatchArray
 from .subtitles import SubtitleProcessor
 from .logging import get_logger
 
 
+MatchesLike = Union[List[AlignmentMatch], AlignmentMatchArray];
+
+
+def _as_match_array( matches: MatchesLike ) -> AlignmentMatchArray:
+    """Accept either AlignmentMatch lists or a prebuilt AlignmentMatchArray."""
+    if isinstance( matches, AlignmentMatchArray ):
+        return matches;
+    return AlignmentMatchArray.from_matches( matches );
+
+
 class OffsetCalculator:
     """
     Calculate time offsets from alignment matches and apply corrections to subtitles.
@@ -24,11 +35,12 @@ class OffsetCalculator:
     - SRT format preservation
     """
     
-    def __init__( self ):
+    def __init__( self, filter_outliers: bool = True ):
         self.logger = get_logger();
         self.offsets = [];  # List of (timestamp, offset) tuples
+        self._filter_outliers = filter_outliers;  # False keeps every offset point (e.g. for comparisons)
     
-    def calculate_sample_offsets( self, matches: List[AlignmentMatch] ) -> List[Tuple[float, float]]:
+    def calculate_sample_offsets( self, matches: MatchesLike ) -> List[Tuple[float, float]]:
         """
         Calculate time offsets from successful alignment matches with weighted averaging.
         
@@ -40,43 +52,35 @@ class OffsetCalculator:
         have more influence on the final correction.
         
         Args:
-            matches: List of AlignmentMatch objects
+            matches: List of AlignmentMatch objects or an AlignmentMatchArray
             
         Returns:
             List of (audio_timestamp, offset_seconds) tuples
         """
-        successful_matches = [ match for match in matches if match.is_match ];
+        successful = _as_match_array( matches ).successful();
         
-        if not successful_matches:
+        if not len( successful ):
             self.logger.warning( "No successful matches for offset calculation" );
             return [];
         
-        self.offsets = [];
-        raw_offsets = [];
-        total_weight = 0.0;
-        weighted_sum = 0.0;
+        # Offset = subtitle time - audio time, weighted by similarity
+        raw_offsets = successful.offset;
+        weights = successful.similarity_score;
+        self.offsets = list( zip( successful.audio_sample_timestamp.tolist(), raw_offsets.tolist() ) );
         
-        for match in successful_matches:
-            # Calculate offset: subtitle time - audio time
-            offset = match.subtitle_timestamp - match.audio_sample_timestamp;
-            weight = match.similarity_score;  # Use similarity as weight
-            
-            self.offsets.append( ( match.audio_sample_timestamp, offset ) );
-            raw_offsets.append( offset );
-            
-            # Accumulate for weighted average
-            weighted_sum += offset * weight;
-            total_weight += weight;
-            
-            self.logger.debug( f"Sample {match.audio_sample_index}: " \
-                             f"audio={match.audio_sample_timestamp/60:.1f}m, " \
-                             f"subtitle={match.subtitle_timestamp/60:.1f}m, " \
-                             f"offset={offset:.1f}s, weight={weight:.3f}" );
+        if self.logger.isEnabledFor( logging.DEBUG ):
+            for index, audio_ts, subtitle_ts, offset, weight in zip( successful.audio_sample_index, successful.audio_sample_timestamp,
+                                                                   successful.subtitle_timestamp, raw_offsets, weights ):
+                self.logger.debug( f"Sample {index}: " \
+                                 f"audio={audio_ts/60:.1f}m, " \
+                                 f"subtitle={subtitle_ts/60:.1f}m, " \
+                                 f"offset={offset:.1f}s, weight={weight:.3f}" );
         
         # Calculate weighted average offset
+        total_weight = float( weights.sum() );
         if total_weight > 0:
-            weighted_avg_offset = weighted_sum / total_weight;
-            simple_avg_offset = sum( raw_offsets ) / len( raw_offsets );
+            weighted_avg_offset = float( raw_offsets @ weights ) / total_weight;
+            simple_avg_offset = float( raw_offsets.mean() );
             
             self.logger.info( f"Offset calculation: Simple avg={simple_avg_offset:.1f}s, " \
                             f"Weighted avg={weighted_avg_offset:.1f}s " \
@@ -99,7 +103,7 @@ class OffsetCalculator:
         self.logger.info( f"Calculated {len( self.offsets )} offset points" );
         return self.offsets;
     
-    def apply_uniform_weighted_offset( self, matches: List[AlignmentMatch] ) -> float:
+    def apply_uniform_weighted_offset( self, matches: MatchesLike ) -> float:
         """
         Calculate a single uniform offset using weighted average of all matches.
         
@@ -107,32 +111,20 @@ class OffsetCalculator:
         where a single global correction is more appropriate than interpolation.
         
         Args:
-            matches: List of AlignmentMatch objects
+            matches: List of AlignmentMatch objects or an AlignmentMatchArray
             
         Returns:
             Weighted average offset in seconds
         """
-        successful_matches = [ match for match in matches if match.is_match ];
-        
-        if not successful_matches:
-            return 0.0;
-        
-        weighted_sum = 0.0;
-        total_weight = 0.0;
-        
-        for match in successful_matches:
-            offset = match.subtitle_timestamp - match.audio_sample_timestamp;
-            weight = match.similarity_score;
-            
-            weighted_sum += offset * weight;
-            total_weight += weight;
+        successful = _as_match_array( matches ).successful();
         
+        total_weight = float( successful.similarity_score.sum() );
         if total_weight > 0:
-            return weighted_sum / total_weight;
+            return float( np.average( successful.offset, weights=successful.similarity_score ) );
         else:
             return 0.0;
     
-    def should_use_uniform_correction( self, matches: List[AlignmentMatch], variance_threshold: float = 5.0 ) -> bool:
+    def should_use_uniform_correction( self, matches: MatchesLike, variance_threshold: float = 5.0 ) -> bool:
         """
         Determine if uniform correction should be used instead of interpolation.
         
@@ -141,29 +133,22 @@ class OffsetCalculator:
         2. We have multiple high-quality matches
         
         Args:
-            matches: List of AlignmentMatch objects
+            matches: List of AlignmentMatch objects or an AlignmentMatchArray
             variance_threshold: Maximum variance in seconds to consider uniform
             
         Returns:
             True if uniform correction should be used
         """
-        successful_matches = [ match for match in matches if match.is_match ];
+        successful = _as_match_array( matches ).successful();
         
-        if len( successful_matches ) < 2:
+        if len( successful ) < 2:
             return False;  # Need multiple matches for variance calculation
         
-        # Calculate offset variance
-        offsets = [ match.subtitle_timestamp - match.audio_sample_timestamp for match in successful_matches ];
-        
-        if len( offsets ) < 2:
-            return False;
-        
-        mean_offset = sum( offsets ) / len( offsets );
-        variance = sum( ( offset - mean_offset ) ** 2 for offset in offsets ) / len( offsets );
-        std_dev = variance ** 0.5;
+        # Calculate offset spread (population standard deviation)
+        std_dev = float( successful.offset.std() );
         
         # Also check if we have good quality matches
-        avg_similarity = sum( match.similarity_score for match in successful_matches ) / len( successful_matches );
+        avg_similarity = float( successful.similarity_score.mean() );
         
         is_consistent = std_dev <= variance_threshold;
         is_high_quality = avg_similarity >= 0.75;  # At least 75% average similarity
@@ -188,26 +173,24 @@ class OffsetCalculator:
         Returns:
             Filtered list of offset points with outliers removed
         """
-        if len( offset_points ) < 3:
-            return offset_points;  # Need at least 3 points for outlier detection
+        if not self._filter_outliers or len( offset_points ) < 3:
+            return offset_points;  # Filtering disabled, or need at least 3 points for outlier detection
         
-        offsets = [ offset for _, offset in offset_points ];
+        offsets = np.fromiter( ( offset for _, offset in offset_points ), dtype=np.float64, count=len( offset_points ) );
         
         if method == "adaptive":
             # Adaptive method for small datasets - uses median and more aggressive thresholds
-            median = statistics.median( offsets );
+            median = float( np.median( offsets ) );
             
-            # Calculate deviations from median
-            deviations = [ abs( offset - median ) for offset in offsets ];
+            # Median absolute deviation from the median
+            mad = float( np.median( np.abs( offsets - median ) ) );
             
             # For small datasets, use stricter threshold based on median absolute deviation
             if len( offset_points ) <= 5:
                 # Very aggressive for small datasets
-                mad = statistics.median( deviations ) if len( deviations ) > 1 else 0;
                 threshold = max( 3.0, 1.5 * mad );  # At least 3s threshold, or 1.5*MAD
             else:
                 # Less aggressive for larger datasets  
-                mad = statistics.median( deviations );
                 threshold = max( 5.0, 2.0 * mad );  # At least 5s threshold, or 2*MAD
             
             lower_bound = median - threshold;
@@ -217,34 +200,21 @@ class OffsetCalculator:
                              f"(median={median:.1f}s, MAD={mad:.1f}s, threshold={threshold:.1f}s)" );
             
         elif method == "iqr":
-            # Interquartile Range method (more robust for small datasets)
-            try:
-                q1 = statistics.quantiles( offsets, n=4 )[0];  # 25th percentile
-                q3 = statistics.quantiles( offsets, n=4 )[2];  # 75th percentile
-                iqr = q3 - q1;
-                
-                # Define outlier bounds (1.5 * IQR is standard)
-                lower_bound = q1 - 1.5 * iqr;
-                upper_bound = q3 + 1.5 * iqr;
-                
-                self.logger.debug( f"IQR outlier bounds: [{lower_bound:.1f}s, {upper_bound:.1f}s]" );
-                
-            except statistics.StatisticsError:
-                # Fall back to simple method if quantiles fail
-                median = statistics.median( offsets );
-                mad = statistics.median( [ abs( offset - median ) for offset in offsets ] );
-                
-                # Use Median Absolute Deviation (MAD) with 2.5 threshold
-                threshold = 2.5 * mad;
-                lower_bound = median - threshold;
-                upper_bound = median + threshold;
-                
-                self.logger.debug( f"MAD outlier bounds: [{lower_bound:.1f}s, {upper_bound:.1f}s]" );
+            # Interquartile Range method (more robust for small datasets);
+            # 'weibull' matches statistics.quantiles' default exclusive method
+            q1, q3 = np.percentile( offsets, [ 25, 75 ], method='weibull' );
+            iqr = q3 - q1;
+            
+            # Define outlier bounds (1.5 * IQR is standard)
+            lower_bound = float( q1 - 1.5 * iqr );
+            upper_bound = float( q3 + 1.5 * iqr );
+            
+            self.logger.debug( f"IQR outlier bounds: [{lower_bound:.1f}s, {upper_bound:.1f}s]" );
                 
         elif method == "zscore":
             # Z-score method (assumes normal distribution)
-            mean_offset = statistics.mean( offsets );
-            std_offset = statistics.stdev( offsets ) if len( offsets ) > 1 else 0;
+            mean_offset = float( offsets.mean() );
+            std_offset = float( offsets.std( ddof=1 ) );
             
             if std_offset == 0:
                 return offset_points;  # No variation, no outliers
@@ -259,16 +229,13 @@ class OffsetCalculator:
         else:
             raise ValueError( f"Unknown outlier detection method: {method}" );
         
-        # Filter outliers
-        filtered_points = [];
-        outliers_detected = [];
+        # Filter outliers with a single vectorized bounds check
+        keep = ( offsets >= lower_bound ) & ( offsets <= upper_bound );
+        filtered_points = [ point for point, kept in zip( offset_points, keep ) if kept ];
+        outliers_detected = [ point for point, kept in zip( offset_points, keep ) if not kept ];
         
-        for timestamp, offset in offset_points:
-            if lower_bound <= offset <= upper_bound:
-                filtered_points.append( ( timestamp, offset ) );
-            else:
-                outliers_detected.append( ( timestamp, offset ) );
-                self.logger.warning( f"Outlier detected: {timestamp/60:.1f}m = {offset:.1f}s (outside bounds)" );
+        for timestamp, offset in outliers_detected:
+            self.logger.warning( f"Outlier detected: {timestamp/60:.1f}m = {offset:.1f}s (outside bounds)" );
         
         if outliers_detected:
             self.logger.info( f"Filtered {len( outliers_detected )} outlier(s) using {method.upper()} method" );
@@ -349,7 +316,7 @@ class OffsetCalculator:
         
         return backup_path;
     
-    def apply_corrections( self, subtitle_file: Path, matches: List[AlignmentMatch] = None, dry_run: bool = False ) -> Path:
+    def apply_corrections( self, subtitle_file: Path, matches: MatchesLike = None, dry_run: bool = False ) -> Path:
         """
         Apply calculated offsets to subtitle file and save corrected version.
         
@@ -358,7 +325,7 @@ class OffsetCalculator:
         
         Args:
             subtitle_file: Path to original subtitle file
-            matches: List of AlignmentMatch objects (for weighted uniform correction)
+            matches: AlignmentMatch list or AlignmentMatchArray (for weighted uniform correction)
             dry_run: If True, don't actually save the corrected file
             
         Returns:
@@ -373,6 +340,9 @@ class OffsetCalculator:
         use_uniform = False;
         uniform_offset = 0.0;
         
+        if matches:
+            matches = _as_match_array( matches );  # Convert once for both uniform-correction checks
+        
         if matches and self.should_use_uniform_correction( matches ):
             uniform_offset = self.apply_uniform_weighted_offset( matches );
             use_uniform = True;
@@ -1,7 +1,10 @@
 """
 Subtitle processing module for parsing, normalizing, and indexing SRT files.
 """
+import math
 import re
+from collections import Counter
+from itertools import count
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
@@ -12,6 +15,77 @@ import pysrt
 from .logging import get_logger
 
 
+# Common words that don't add meaning to word-overlap scoring
+_STOPWORDS = frozenset( {
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are',
+    'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'can', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'this', 'that',
+    'these', 'those'
+} );
+
+# Sentence terminators for the structure-similarity factor
+_SENT_RE = re.compile( r'[.!?]+' );
+
+# Content type indicators (dialogue vs music/effects)
+_MUSIC_INDICATORS = frozenset( { 'music', 'song', 'singing', 'melody', 'tune', 'beat', 'rhythm', 'instrumental' } );
+_DIALOGUE_INDICATORS = frozenset( { 'said', 'told', 'asked', 'replied', 'answered', 'explained', 'whispered', 'shouted', 'called' } );
+
+# ( token_counts, token_norm, sentence_count, music_share, dialogue_share )
+TextFeatures = Tuple[Counter, float, int, float, float];
+
+# Process-wide token interning: word -> small int id, so word-overlap set operations
+# hash and compare ints instead of strings. Ids come from an atomic counter, so
+# concurrent callers can never hand the same id to two words.
+_TOKEN_IDS: Dict[str, int] = {};
+_NEXT_TOKEN_ID = count();
+
+
+def _token_id( word: str ) -> int:
+    """Get the interned id for a word, assigning a new one on first sight."""
+    token_id = _TOKEN_IDS.get( word );
+    if token_id is None:
+        token_id = _TOKEN_IDS.setdefault( word, next( _NEXT_TOKEN_ID ) );
+    return token_id;
+
+
+def _indicator_share( words: frozenset, indicators: frozenset ) -> float:
+    """Fraction of words that are content-type indicators, without building an intersection set."""
+    if words.isdisjoint( indicators ):
+        return 0.0;
+    return sum( 1 for word in indicators if word in words ) / len( words );
+
+
+def text_features( text_lower: str ) -> TextFeatures:
+    """
+    Extract every text-only similarity feature from lowercased text in one place.
+    
+    Everything that depends on a single text is computed here once, leaving only
+    the pairwise terms for AlignmentEngine.calculate_weighted_similarity.
+    
+    Args:
+        text_lower: Lowercased text
+        
+    Returns:
+        Tuple of (token_counts, token_norm, sentence_count, music_share, dialogue_share) -
+        multiset of interned ids of the stopword-filtered words and its L2 norm (for
+        cosine word overlap), number of sentence fragments, and the fraction of
+        distinct meaningful words that are music / dialogue indicators
+    """
+    # One filtering pass over the tokens; the rest run over C-level builtins, which
+    # measures faster than folding the indicator counts into a Python-level loop
+    words = [ word for word in text_lower.split() if word not in _STOPWORDS ];
+    meaningful_words = frozenset( words );
+    token_counts = Counter( map( _token_id, words ) );
+    sentence_count = len( _SENT_RE.split( text_lower ) );
+    return (
+        token_counts,
+        math.sqrt( sum( n * n for n in token_counts.values() ) ),
+        sentence_count,
+        _indicator_share( meaningful_words, _MUSIC_INDICATORS ),
+        _indicator_share( meaningful_words, _DIALOGUE_INDICATORS )
+    );
+
+
 class SubtitleEntry:
     """Represents a single subtitle entry with timing and text."""
     
@@ -44,6 +118,8 @@ class SubtitleProcessor:
         self.min_chars = min_chars;
         self.subtitle_entries = [];
         self.minute_index = {};  # minute -> list of SubtitleEntry objects
+        self._minute_features = {};  # minute -> (lower_text, TextFeatures)
+        self.minute_first_ts = {};  # minute -> start time of its earliest subtitle (seconds)
     
     def validate_subtitle_file( self, subtitle_file: Path ) -> bool:
         """
@@ -142,7 +218,8 @@ class SubtitleProcessor:
         
         # Log significant cleaning for debugging
         if len( original_text ) > len( text ) + 20:  # Significant reduction
-            self.logger.debug( f"Significant text cleaning: '{original_text[:50]}...' -> '{text[:50]}...'" );
+            # Lazy %-formatting - runs per subtitle, so only format when debugging
+            self.logger.debug( "Significant text cleaning: '%.50s...' -> '%.50s...'", original_text, text );
         
         return text;
     
@@ -212,6 +289,8 @@ class SubtitleProcessor:
             Dictionary mapping minute number to list of SubtitleEntry objects
         """
         self.minute_index = {};
+        self._minute_features = {};
+        self.minute_first_ts = {};
         
         for entry in self.subtitle_entries:
             # Calculate minute (0-based, as movies start at 0:00)
@@ -219,6 +298,9 @@ class SubtitleProcessor:
             
             if minute not in self.minute_index:
                 self.minute_index[minute] = [];
+                self.minute_first_ts[minute] = entry.start_time;
+            elif entry.start_time < self.minute_first_ts[minute]:
+                self.minute_first_ts[minute] = entry.start_time;
             
             self.minute_index[minute].append( entry );
         
@@ -246,6 +328,26 @@ class SubtitleProcessor:
         combined_text = " ".join( texts );
         return combined_text;
     
+    def get_minute_features( self, minute: int ) -> Tuple[str, TextFeatures]:
+        """
+        Get similarity features for a minute's text, computed once per minute.
+        
+        The same minute is scored against every audio sample, so the lowercased
+        text and its text_features() are cached until the index is rebuilt.
+        
+        Args:
+            minute: Minute number (0-based)
+            
+        Returns:
+            Tuple of (lower_text, TextFeatures)
+        """
+        features = self._minute_features.get( minute );
+        if features is None:
+            lower_text = self.get_minute_text( minute ).lower();
+            features = ( lower_text, text_features( lower_text ) );
+            self._minute_features[minute] = features;
+        return features;
+    
     def get_minutes_with_min_chars( self ) -> List[int]:
         """
         Get list of minutes that have at least min_chars characters.
@@ -2,8 +2,10 @@
 Main subtitle synchronization controller that orchestrates the entire process.
 """
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from .audio import AudioProcessor, AudioSample, AdaptiveSamplingCoordinator
 from .transcribe import create_transcription_engine, TranscriptionEngine
@@ -67,13 +69,14 @@ class SubtitleSynchronizer:
         );
         self.offset_calculator = OffsetCalculator();
         self.adaptive_sampling = AdaptiveSamplingCoordinator( debug=debug );
+        self.transcription_workers = 4;  # Concurrent API requests - transcription is network-bound
         
         # Results storage
         self.audio_samples: List[AudioSample] = [];
         self.alignment_matches: List[AlignmentMatch] = [];
         self.current_phase = "initial";  # Track sampling phase
     
-    def extract_audio_samples( self ) -> List[AudioSample]:
+    def extract_audio_samples( self, on_extracted: Optional[Callable[[AudioSample], None]] = None ) -> List[AudioSample]:
         """Extract audio samples from video file using adaptive sampling."""
         self.logger.info( "=== STEP 1: AUDIO EXTRACTION (ADAPTIVE) ===" );
         
@@ -89,7 +92,8 @@ class SubtitleSynchronizer:
         
         self.audio_samples = self.audio_processor.extract_audio_samples( 
             self.video_file, 
-            num_samples=recommended_samples
+            num_samples=recommended_samples,
+            on_extracted=on_extracted
         );
         
         if not self.audio_samples:
@@ -100,27 +104,45 @@ class SubtitleSynchronizer:
         self.logger.info( f"Successfully extracted {len( self.audio_samples )} audio samples (est. cost: ${cost:.3f})" );
         return self.audio_samples;
     
-    def transcribe_audio_samples( self ) -> List[AudioSample]:
-        """Transcribe audio samples using AI."""
+    def extract_and_transcribe_samples( self ) -> List[AudioSample]:
+        """
+        Extract audio samples and transcribe each one as soon as it is extracted.
+        
+        Extraction is FFmpeg (CPU) work and transcription is API (network) work,
+        so overlapping them hides most of the extraction time behind the first
+        transcription requests.
+        """
+        in_flight: Dict[int, Future] = {};
+        with ThreadPoolExecutor( max_workers=self.transcription_workers ) as executor:
+            def start_transcription( sample: AudioSample ):
+                in_flight[sample.index] = executor.submit( self._transcribe_sample, sample );
+            
+            self.extract_audio_samples( on_extracted=start_transcription );
+            return self.transcribe_audio_samples( executor, in_flight );
+    
+    def transcribe_audio_samples( self, executor: Optional[ThreadPoolExecutor] = None,
+                                  in_flight: Optional[Dict[int, Future]] = None ) -> List[AudioSample]:
+        """
+        Transcribe audio samples using AI.
+        
+        Samples are transcribed concurrently (transcription_workers requests at a
+        time). executor is the pool that in_flight transcriptions were started on
+        during extraction; the remaining samples go to the same pool, so the
+        request limit holds across both. Without one, a pool is opened here.
+        """
         self.logger.info( "=== STEP 2: AI TRANSCRIPTION ===" );
         
         if not self.audio_samples:
             raise RuntimeError( "No audio samples to transcribe. Run extract_audio_samples first." );
         
-        transcribed_count = 0;
-        
-        for sample in self.audio_samples:
-            try:
-                sample.transcription = self.transcription_engine.transcribe( sample );
-                if sample.transcription:
-                    transcribed_count += 1;
-                    self.logger.debug( f"Sample {sample.index} transcribed: " \
-                                     f"'{sample.transcription[:50]}...'" );
-                else:
-                    self.logger.warning( f"Sample {sample.index} transcription failed" );
-                    
-            except Exception as e:
-                self.logger.error( f"Transcription failed for sample {sample.index}: {e}" );
+        in_flight = dict( in_flight or {} );
+        pool = nullcontext( executor ) if executor is not None else ThreadPoolExecutor( max_workers=self.transcription_workers );
+        with pool as executor:
+            for sample in self.audio_samples:
+                if sample.index not in in_flight:
+                    in_flight[sample.index] = executor.submit( self._transcribe_sample, sample );
+            # Collected in sample order, whatever order the requests finish in
+            transcribed_count = sum( in_flight[sample.index].result() for sample in self.audio_samples );
         
         if transcribed_count == 0:
             raise RuntimeError( "Failed to transcribe any audio samples" );
@@ -128,6 +150,20 @@ class SubtitleSynchronizer:
         self.logger.info( f"Successfully transcribed {transcribed_count}/{len( self.audio_samples )} samples" );
         return self.audio_samples;
     
+    def _transcribe_sample( self, sample: AudioSample ) -> bool:
+        """Transcribe one sample in place; returns whether it produced any text."""
+        try:
+            sample.transcription = self.transcription_engine.transcribe( sample );
+            if sample.transcription:
+                self.logger.debug( f"Sample {sample.index} transcribed: " \
+                                 f"'{sample.transcription[:50]}...'" );
+                return True;
+            self.logger.warning( f"Sample {sample.index} transcription failed" );
+            
+        except Exception as e:
+            self.logger.error( f"Transcription failed for sample {sample.index}: {e}" );
+        return False;
+    
     def parse_subtitles( self ) -> SubtitleProcessor:
         """Parse and index subtitle file."""
         self.logger.info( "=== STEP 3: SUBTITLE PROCESSING ===" );
@@ -338,8 +374,7 @@ class SubtitleSynchronizer:
             self.alignment_matches = [];
             
             # Run refinement pipeline
-            self.extract_audio_samples();
-            self.transcribe_audio_samples();
+            self.extract_and_transcribe_samples();
             self.parse_subtitles();  # Re-parse the corrected subtitle file
             self.align_transcripts();
             
@@ -577,11 +612,8 @@ class SubtitleSynchronizer:
             self.logger.info( f"Similarity threshold: {self.similarity_threshold:.1%}" );
             self.logger.info( f"Search window: {self.search_window} minutes" );
             
-            # Step 1: Extract audio samples
-            self.extract_audio_samples();
-            
-            # Step 2: Transcribe audio using AI
-            self.transcribe_audio_samples();
+            # Steps 1-2: Extract audio samples, transcribing each as soon as it is extracted
+            self.extract_and_transcribe_samples();
             
             # Step 3: Parse and index subtitles
             self.parse_subtitles();
@@ -133,7 +133,7 @@ class WhisperEngine( TranscriptionEngine ):
         Transcribe audio sample using OpenAI Whisper API.
         
         Args:
-            audio_sample: AudioSample object with file path
+            audio_sample: AudioSample object with audio
             
         Returns:
             Cleaned transcript text
@@ -141,16 +141,23 @@ class WhisperEngine( TranscriptionEngine ):
         self.logger.debug( f"Transcribing {audio_sample} with Whisper" );
         
         def _transcribe():
-            with open( audio_sample.file_path, "rb" ) as audio_file:
-                response = self.client.audio.transcriptions.create(
-                    model=self.model,
-                    file=audio_file,
-                    response_format="text",
-                    prompt="Return only the spoken words without any formatting, timestamps, or descriptions."
-                );
-                return response;
+            response = self.client.audio.transcriptions.create(
+                model=self.model,
+                file=upload,
+                response_format="text",
+                prompt="Return only the spoken words without any formatting, timestamps, or descriptions."
+            );
+            return response;
         
         try:
+            # Samples live in memory - upload them as a named in-memory file, Opus-compressed
+            # when FFmpeg can encode it (upload-bound), else as plain WAV; encoded once for all retries
+            opus = audio_sample.opus_bytes();
+            if opus:
+                upload = ( f"sample_{audio_sample.index:03d}.ogg", opus );
+            else:
+                upload = ( f"sample_{audio_sample.index:03d}.wav", audio_sample.wav_bytes() );
+            
             transcript = self.retry_with_backoff( _transcribe );
             cleaned_text = self.clean_transcript( transcript );
             
@@ -190,7 +197,7 @@ class GoogleSpeechEngine( TranscriptionEngine ):
         Transcribe audio sample using Google Speech-to-Text API.
         
         Args:
-            audio_sample: AudioSample object with file path
+            audio_sample: AudioSample object with audio
             
         Returns:
             Cleaned transcript text
@@ -198,11 +205,8 @@ class GoogleSpeechEngine( TranscriptionEngine ):
         self.logger.debug( f"Transcribing {audio_sample} with Google Speech" );
         
         def _transcribe():
-            # Read audio file
-            with open( audio_sample.file_path, "rb" ) as audio_file:
-                content = audio_file.read();
-            
-            audio = speech.RecognitionAudio( content=content );
+            # WAV bytes straight from memory
+            audio = speech.RecognitionAudio( content=audio_sample.wav_bytes() );
             
             # Perform transcription
             response = self.client.recognize( 
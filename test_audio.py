@@ -87,14 +87,14 @@ def test_single_audio_extraction(processor):
         
         if sample:
             print(f"✓ Audio sample extracted: {sample}")
-            print(f"✓ Sample file exists: {sample.file_path.exists()}")
-            if sample.file_path.exists():
-                file_size = sample.file_path.stat().st_size
-                print(f"✓ Sample file size: {file_size} bytes ({file_size/1024:.1f} KB)")
+            print(f"✓ Sample PCM in memory: {sample.pcm is not None}")
+            if sample.pcm is not None:
+                wav_size = len(sample.wav_bytes())
+                print(f"✓ Sample WAV size: {wav_size} bytes ({wav_size/1024:.1f} KB)")
                 
-                # Clean up test file
-                sample.file_path.unlink()
-                print("✓ Test file cleaned up")
+                # Release sample audio
+                processor.cleanup_samples([sample])
+                print("✓ Test sample cleaned up")
             
             return True
         else:
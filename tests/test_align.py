@@ -0,0 +1,31 @@
+"""
+Test cases for alignment result objects.
+"""
+import copy
+import pickle
+from pathlib import Path
+import sys
+
+# Add src directory to path for testing
+sys.path.insert( 0, str( Path( __file__ ).parent.parent / "src" ) );
+
+from subshift.align import AlignmentMatch
+
+
+class TestAlignmentMatch:
+    """Test cases for the frozen, slotted AlignmentMatch."""
+    
+    def make_match( self ):
+        return AlignmentMatch( 3, 180.0, "hello there", 4, 245.5, "hello there", 0, 1.0, True );
+    
+    def test_offset_is_derived( self ):
+        assert self.make_match().offset == 65.5;
+    
+    def test_copy_and_pickle_round_trip( self ):
+        """Frozen dataclasses reject the default setattr-based slot restore."""
+        match = self.make_match();
+        
+        for clone in ( copy.copy( match ), copy.deepcopy( match ), pickle.loads( pickle.dumps( match ) ) ):
+            assert clone == match;
+            assert clone is not match;
+            assert clone.offset == match.offset;
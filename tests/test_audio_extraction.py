@@ -0,0 +1,127 @@
+"""
+Test cases for batched audio sample extraction (slicing the shared PCM buffer).
+"""
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+import numpy as np
+
+# Add src directory to path for testing
+sys.path.insert( 0, str( Path( __file__ ).parent.parent / "src" ) );
+
+from subshift.audio import AudioProcessor, AudioSample
+
+
+RATE = 16000;
+
+
+def padded_buffer( *segments ):
+    """Concatenate per-sample PCM the way the padded batch command returns it."""
+    return np.concatenate( segments ).astype( np.int16 );
+
+
+class TestBatchExtraction:
+    """Test cases for slicing one padded FFmpeg run back into samples."""
+    
+    @pytest.fixture
+    def processor( self, tmp_path ):
+        return AudioProcessor( temp_dir=tmp_path, max_workers=1 );
+    
+    def extract( self, processor, specs, pcm, media_duration ):
+        with patch.object( processor, 'get_video_duration', return_value=media_duration ), \
+             patch.object( processor, '_run_pcm', return_value=pcm ):
+            return processor.extract_audio_samples_batch( Path( "video.mkv" ), specs );
+    
+    def test_trailing_silence_is_kept( self, processor ):
+        """Real digital silence at the end of a clip is audio, not padding."""
+        tone = np.full( RATE, 1000, dtype=np.int16 );
+        silence = np.zeros( RATE, dtype=np.int16 );
+        pcm = padded_buffer( tone, silence, silence, silence );
+        
+        samples = self.extract( processor, [ ( 10.0, 0, 2 ), ( 20.0, 1, 2 ) ], pcm, media_duration=600.0 );
+        
+        assert [ sample.index for sample in samples ] == [ 0, 1 ];
+        assert len( samples[0].pcm ) == 2 * RATE;
+        assert len( samples[1].pcm ) == 2 * RATE;  # Entirely silent, still a sample
+        assert not samples[1].pcm.any();
+    
+    def test_segment_cut_at_media_end( self, processor ):
+        """Only the decoded part of a segment that runs past the end is kept."""
+        pcm = padded_buffer( np.ones( 2 * RATE, dtype=np.int16 ), np.ones( 2 * RATE, dtype=np.int16 ) );
+        
+        samples = self.extract( processor, [ ( 0.0, 0, 2 ), ( 99.5, 1, 2 ) ], pcm, media_duration=100.0 );
+        
+        assert len( samples[0].pcm ) == 2 * RATE;
+        assert len( samples[1].pcm ) == RATE // 2;
+    
+    def test_segment_past_media_end_is_dropped( self, processor ):
+        pcm = padded_buffer( np.ones( RATE, dtype=np.int16 ), np.zeros( RATE, dtype=np.int16 ) );
+        
+        samples = self.extract( processor, [ ( 0.0, 0, 1 ), ( 120.0, 1, 1 ) ], pcm, media_duration=100.0 );
+        
+        assert [ sample.index for sample in samples ] == [ 0 ];
+    
+    def test_unknown_media_duration_extracts_individually( self, processor ):
+        """Without a duration the padding can't be stripped, so each sample is extracted on its own."""
+        specs = [ ( 0.0, 0, 1 ), ( 5.0, 1, 1 ) ];
+        
+        with patch.object( processor, 'extract_audio_sample', return_value=None ) as single:
+            samples = self.extract( processor, specs, np.zeros( 2 * RATE, dtype=np.int16 ), media_duration=None );
+        
+        assert samples == [];
+        assert [ call.args[1:] for call in single.call_args_list ] == [ ( 0.0, 0, 1 ), ( 5.0, 1, 1 ) ];
+
+
+class TestRetryPositions:
+    """Test cases for retrying failed samples at unused positions."""
+    
+    @pytest.fixture
+    def processor( self, tmp_path ):
+        return AudioProcessor( temp_dir=tmp_path, max_workers=1 );
+    
+    def test_short_video_keeps_off_grid_reserve( self, processor ):
+        """Every grid position is chosen for a 20-minute episode; retries fall back to off-grid ones."""
+        chosen, reserve = processor.generate_sample_candidates( 20 * 60 );
+        
+        assert chosen == [ 180.0, 330.0, 480.0, 630.0, 780.0 ];
+        assert sorted( reserve ) == [ 255.0, 405.0, 555.0, 705.0 ];  # Midpoints whose sample ends before the credits
+    
+    def test_long_video_reserve_prefers_unchosen_grid( self, processor ):
+        """Unchosen grid positions (180 + k * 150) come first, off-grid midpoints after."""
+        chosen, reserve = processor.generate_sample_candidates( 100 * 60, num_samples=12 );
+        on_grid = [ t % 150.0 == 30.0 for t in reserve ];
+        
+        assert not set( chosen ) & set( reserve );
+        assert on_grid == sorted( on_grid, reverse=True );
+        assert len( chosen ) + on_grid.count( True ) == 37;  # Every grid position is chosen or in reserve
+        assert on_grid.count( False ) > 0;
+    
+    def test_failed_samples_retried_on_short_video( self, processor ):
+        extracted = [ AudioSample( index, start ) for index, start in ( ( 0, 180.0 ), ( 2, 480.0 ), ( 3, 630.0 ), ( 4, 780.0 ) ) ];
+        
+        with patch.object( processor, 'get_video_duration', return_value=20 * 60.0 ), \
+             patch.object( processor, 'extract_multi_duration_samples', return_value=list( extracted ) ), \
+             patch.object( processor, 'extract_audio_samples_batch', return_value=[ AudioSample( 5, 255.0 ) ] ) as retry:
+            samples = processor.extract_audio_samples( Path( "episode.mkv" ) );
+        
+        specs = retry.call_args.args[1];
+        assert len( specs ) == 1;
+        assert specs[0][0] in ( 255.0, 405.0, 555.0, 705.0 );
+        assert specs[0][1] == 5;  # Index after the attempted samples
+        assert len( samples ) == 5;
+    
+    def test_no_reserve_warns_instead_of_retrying( self, processor ):
+        with patch.object( processor, 'get_video_duration', return_value=20 * 60.0 ), \
+             patch.object( processor, 'generate_sample_candidates', return_value=( [ 180.0, 330.0 ], [] ) ), \
+             patch.object( processor, 'extract_multi_duration_samples', return_value=[ AudioSample( 0, 180.0 ) ] ), \
+             patch.object( processor, 'extract_audio_samples_batch' ) as retry, \
+             patch.object( processor.logger, 'warning' ) as warning, \
+             patch.object( processor.logger, 'info' ) as info:
+            samples = processor.extract_audio_samples( Path( "episode.mkv" ) );
+        
+        retry.assert_not_called();
+        assert len( samples ) == 1;
+        assert "No unused sample positions" in warning.call_args.args[0];
+        assert not any( "Retrying" in str( call.args[0] ) for call in info.call_args_list );
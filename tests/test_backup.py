@@ -0,0 +1,112 @@
+"""
+Test cases for backup discovery and the retention policy.
+"""
+import pytest
+from pathlib import Path
+import sys
+
+# Add src directory to path for testing
+sys.path.insert( 0, str( Path( __file__ ).parent.parent / "src" ) );
+
+from subshift.backup import BackupManager
+
+
+def stamp( minute: int ) -> str:
+    """Backup timestamp for the given minute offset, in the filename format."""
+    return f"2024-01-01T{minute // 60:02d}-{minute % 60:02d}-00";
+
+
+def make_backup( backup_dir: Path, name: str, size: int = 10 ) -> Path:
+    path = backup_dir / name;
+    path.write_bytes( b"x" * size );
+    return path;
+
+
+class TestGetExistingBackups:
+    """Test cases for matching backup files to their original."""
+    
+    @pytest.fixture
+    def manager( self, tmp_path ):
+        return BackupManager( tmp_path / "backup" );
+    
+    def test_matches_only_own_backups( self, manager ):
+        """movie.srt must not pick up backups of movie.en.srt, and vice versa."""
+        own = make_backup( manager.backup_dir, f"movie.{stamp( 1 )}.srt" );
+        make_backup( manager.backup_dir, f"movie.en.{stamp( 2 )}.srt" );
+        make_backup( manager.backup_dir, f"movie.{stamp( 3 )}.ass" );
+        make_backup( manager.backup_dir, f"other.{stamp( 4 )}.srt" );
+        
+        backups = manager.get_existing_backups( Path( "movie.srt" ) );
+        
+        assert [ path for path, _, _ in backups ] == [ own ];
+        assert [ path.name for path, _, _ in manager.get_existing_backups( Path( "movie.en.srt" ) ) ] == [ f"movie.en.{stamp( 2 )}.srt" ];
+    
+    def test_malformed_timestamp_is_skipped( self, manager ):
+        """A same-length name without a valid timestamp is not a backup."""
+        own = make_backup( manager.backup_dir, f"movie.{stamp( 1 )}.srt" );
+        make_backup( manager.backup_dir, "movie.2024-01-01 00:00:00.srt" );
+        make_backup( manager.backup_dir, "movie.not-a-timestamp-xyz.srt" );
+        
+        backups = manager.get_existing_backups( Path( "movie.srt" ) );
+        
+        assert [ path for path, _, _ in backups ] == [ own ];
+    
+    def test_sorted_oldest_first_with_sizes( self, manager ):
+        for minute in ( 30, 5, 90 ):
+            make_backup( manager.backup_dir, f"movie.{stamp( minute )}.srt", size=minute );
+        
+        backups = manager.get_existing_backups( Path( "movie.srt" ) );
+        
+        assert [ timestamp for _, timestamp, _ in backups ] == [ stamp( 5 ), stamp( 30 ), stamp( 90 ) ];
+        assert [ size for _, _, size in backups ] == [ 5, 30, 90 ];
+    
+    def test_backup_filename_round_trips( self, manager ):
+        """Names produced by get_backup_filename are found again."""
+        original = Path( "movie.srt" );
+        make_backup( manager.backup_dir, manager.get_backup_filename( original ) );
+        
+        assert len( manager.get_existing_backups( original ) ) == 1;
+
+
+class TestRetentionPolicy:
+    """Test cases for pruning backups down to the size-based limit."""
+    
+    @pytest.fixture
+    def manager( self, tmp_path ):
+        return BackupManager( tmp_path / "backup" );
+    
+    def test_keeps_exactly_newest_small_backups( self, manager, tmp_path ):
+        original = tmp_path / "movie.srt";
+        original.write_bytes( b"x" * 100 );
+        for minute in range( manager.max_small_files + 5 ):
+            make_backup( manager.backup_dir, f"movie.{stamp( minute )}.srt" );
+        
+        manager.apply_retention_policy( original );
+        
+        kept = [ timestamp for _, timestamp, _ in manager.get_existing_backups( original ) ];
+        assert kept == [ stamp( minute ) for minute in range( 5, manager.max_small_files + 5 ) ];
+    
+    def test_large_files_use_lower_limit( self, manager, tmp_path ):
+        original = tmp_path / "movie.srt";
+        original.write_bytes( b"x" * manager.size_threshold );
+        for minute in range( manager.max_large_files + 3 ):
+            make_backup( manager.backup_dir, f"movie.{stamp( minute )}.srt" );
+        
+        manager.apply_retention_policy( original );
+        
+        kept = [ timestamp for _, timestamp, _ in manager.get_existing_backups( original ) ];
+        assert kept == [ stamp( minute ) for minute in range( 3, manager.max_large_files + 3 ) ];
+    
+    def test_other_files_are_never_removed( self, manager, tmp_path ):
+        original = tmp_path / "movie.srt";
+        original.write_bytes( b"x" );
+        for minute in range( manager.max_small_files + 1 ):
+            make_backup( manager.backup_dir, f"movie.{stamp( minute )}.srt" );
+        sibling = make_backup( manager.backup_dir, f"movie.en.{stamp( 0 )}.srt" );
+        malformed = make_backup( manager.backup_dir, "movie.not-a-timestamp-xyz.srt" );
+        
+        manager.apply_retention_policy( original );
+        
+        assert not ( manager.backup_dir / f"movie.{stamp( 0 )}.srt" ).exists();
+        assert sibling.exists();
+        assert malformed.exists();
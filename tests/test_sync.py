@@ -0,0 +1,116 @@
+"""
+Test cases for concurrent sample transcription in the synchronizer.
+"""
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, patch
+import sys
+import threading
+import time
+
+# Add src directory to path for testing
+sys.path.insert( 0, str( Path( __file__ ).parent.parent / "src" ) );
+
+from subshift.audio import AudioSample
+from subshift.sync import SubtitleSynchronizer
+
+
+class StubEngine:
+    """Transcription engine stub: sample 2 raises, sample 3 returns nothing."""
+    
+    def __init__( self, release: threading.Event = None ):
+        self.release = release;
+    
+    def transcribe( self, sample: AudioSample ) -> str:
+        if self.release is not None and sample.index == 0:
+            self.release.wait( timeout=5 );  # Finish the first sample last
+        if sample.index == 2:
+            raise RuntimeError( "API error" );
+        if sample.index == 3:
+            return "";
+        return f"text {sample.index}";
+
+
+def make_samples( count: int ):
+    return [ AudioSample( index, index * 60.0 ) for index in range( count ) ];
+
+
+class TestTranscription:
+    """Test cases for transcribe_audio_samples and extract_and_transcribe_samples."""
+    
+    def make_sync( self, tmp_path, engine ):
+        with patch( 'subshift.sync.create_transcription_engine', return_value=engine ):
+            return SubtitleSynchronizer( tmp_path / "video.mkv", tmp_path / "video.srt" );
+    
+    def test_results_in_sample_order_despite_failures( self, tmp_path ):
+        release = threading.Event();
+        sync = self.make_sync( tmp_path, StubEngine( release ) );
+        sync.audio_samples = make_samples( 6 );
+        
+        # Let every later sample finish before sample 0 returns
+        threading.Timer( 0.2, release.set ).start();
+        samples = sync.transcribe_audio_samples();
+        
+        assert [ sample.index for sample in samples ] == [ 0, 1, 2, 3, 4, 5 ];
+        assert [ sample.transcription for sample in samples ] == [ "text 0", "text 1", None, "", "text 4", "text 5" ];
+    
+    def test_all_failed_raises( self, tmp_path ):
+        engine = Mock();
+        engine.transcribe.side_effect = RuntimeError( "API error" );
+        sync = self.make_sync( tmp_path, engine );
+        sync.audio_samples = make_samples( 3 );
+        
+        with pytest.raises( RuntimeError, match="Failed to transcribe any audio samples" ):
+            sync.transcribe_audio_samples();
+        assert engine.transcribe.call_count == 3;
+    
+    def test_extract_and_transcribe_overlaps_extraction( self, tmp_path ):
+        """Samples reported during extraction are transcribed once, in sample order."""
+        engine = StubEngine();
+        engine.transcribe = Mock( side_effect=engine.transcribe );
+        sync = self.make_sync( tmp_path, engine );
+        samples = make_samples( 5 );
+        
+        def extract( video_file, num_samples, on_extracted ):
+            for index in ( 4, 1, 3 ):  # Batches finish out of order; 0 and 2 are never reported
+                on_extracted( samples[index] );
+            return samples;
+        
+        with patch.object( sync.audio_processor, 'extract_audio_samples', side_effect=extract ):
+            result = sync.extract_and_transcribe_samples();
+        
+        assert [ sample.index for sample in result ] == [ 0, 1, 2, 3, 4 ];
+        assert [ sample.transcription for sample in result ] == [ "text 0", "text 1", None, "", "text 4" ];
+        assert sorted( call.args[0].index for call in engine.transcribe.call_args_list ) == [ 0, 1, 2, 3, 4 ];
+    
+    def test_extract_and_transcribe_shares_one_pool( self, tmp_path ):
+        """Requests started during extraction and afterwards share the transcription_workers limit."""
+        lock = threading.Lock();
+        active = [ 0 ];
+        peak = [ 0 ];
+        
+        def transcribe( sample ):
+            with lock:
+                active[0] += 1;
+                peak[0] = max( peak[0], active[0] );
+            time.sleep( 0.05 );
+            with lock:
+                active[0] -= 1;
+            return f"text {sample.index}";
+        
+        engine = Mock();
+        engine.transcribe.side_effect = transcribe;
+        sync = self.make_sync( tmp_path, engine );
+        sync.transcription_workers = 2;
+        samples = make_samples( 8 );
+        
+        def extract( video_file, num_samples, on_extracted ):
+            for sample in samples[:4]:
+                on_extracted( sample );
+            return samples;
+        
+        with patch.object( sync.audio_processor, 'extract_audio_samples', side_effect=extract ):
+            sync.extract_and_transcribe_samples();
+        
+        assert engine.transcribe.call_count == 8;
+        assert peak[0] == 2;